@@ -0,0 +1,37 @@
+"""
+Ahead-of-time build for the numeric kernels used by integrated_sysyem.
+
+@njit(cache=True) caches machine code on disk but still pays a
+multi-second compile on the very first run, and cache invalidation
+(numba upgrade, source change) brings the stall back in production.
+Building the kernels into an extension module once per deploy removes
+it entirely:
+
+    python compile_kernels.py
+
+produces integrated_kernels.<abi>.so next to this file, which
+integrated_sysyem imports in preference to the JIT versions.
+"""
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('integrated_kernels')
+
+
+@cc.export('screen_signals', 'b1[:](i1[:], f8[:])')
+def screen_signals(signal_codes, positions_qty):
+    """Mark symbols needing Python-side portfolio processing.
+
+    Keep this in sync with _screen_signals in integrated_sysyem.py,
+    which is the JIT/numpy fallback for the same logic.
+    """
+    n = signal_codes.shape[0]
+    needs = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if signal_codes[i] != 0 or positions_qty[i] != 0.0:
+            needs[i] = True
+    return needs
+
+
+if __name__ == '__main__':
+    cc.compile()
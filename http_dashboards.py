@@ -2,13 +2,30 @@
 HTTP Dashboards Server - Complete Cognitive Mesh Control Panel
 Pure Python stdlib (no external dependencies)
 """
+import asyncio
 import threading
+import gzip
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+import hashlib
+import socket
 import time
 
+# Optional fast JSON serializer (5-6x faster than stdlib for dumps)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary metrics encoding for machine clients (smaller payloads,
+# cheaper decode than JSON); the endpoint falls back to JSON without it
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
 # Main Dashboard HTML
@@ -309,10 +326,16 @@ DASHBOARD_HTML = """
     </div>
     
     <script>
+        // Sequence of the last payload whose lists we rendered; sending it
+        // back lets the server omit unchanged lists from the response.
+        let lastSeq = null;
+
         async function updateDashboard() {
             try {
-                const response = await fetch('/api/metrics');
+                const url = lastSeq === null ? '/api/metrics' : `/api/metrics?since=${lastSeq}`;
+                const response = await fetch(url);
                 const data = await response.json();
+                lastSeq = data.seq !== undefined ? data.seq : null;
                 
                 // Update basic metrics
                 document.getElementById('uptime').textContent = formatUptime(data.uptime_seconds || 0);
@@ -385,76 +408,430 @@ DASHBOARD_HTML = """
 </html>
 """
 
+# Templates are immutable; encode once at import time instead of on every
+# request so the handler can serve cached bytes with a known Content-Length.
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode('utf-8')
+# Pre-gzipped variant, compressed once at import and served to clients
+# that advertise Accept-Encoding: gzip.
+DASHBOARD_HTML_GZ = gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=6)
+# Stable ETag so browsers can revalidate with If-None-Match and get a
+# body-less 304 instead of re-downloading the template on every refresh.
+DASHBOARD_ETAG = '"' + hashlib.md5(DASHBOARD_HTML_BYTES).hexdigest() + '"'
+NOT_FOUND_BYTES = b"<h1>404 Not Found</h1>"
+
+
+def _build_response(status: str, content_type: str, body: bytes,
+                    etag: str = None, encoding: str = None,
+                    cache_control: str = None) -> bytes:
+    """Assemble a complete HTTP/1.1 wire response as one bytes object.
+
+    send_response/send_header issue several small writes per response
+    (status line, each header, terminator, body); baking the whole
+    response into one buffer lets the handler emit it with a single
+    wfile.write.
+    """
+    lines = [
+        f'HTTP/1.1 {status}',
+        f'Content-Type: {content_type}',
+        f'Content-Length: {len(body)}',
+        'Connection: keep-alive',
+    ]
+    if encoding:
+        lines.append(f'Content-Encoding: {encoding}')
+    if etag:
+        lines.append(f'ETag: {etag}')
+    if cache_control:
+        lines.append(f'Cache-Control: {cache_control}')
+    head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    return head + body
+
+
+# Complete wire responses for the immutable routes, baked at import.
+DASHBOARD_RESP = _build_response(
+    '200 OK', 'text/html; charset=utf-8', DASHBOARD_HTML_BYTES,
+    etag=DASHBOARD_ETAG, cache_control='public, max-age=60')
+DASHBOARD_RESP_GZ = _build_response(
+    '200 OK', 'text/html; charset=utf-8', DASHBOARD_HTML_GZ,
+    etag=DASHBOARD_ETAG, encoding='gzip', cache_control='public, max-age=60')
+DASHBOARD_RESP_304 = (
+    'HTTP/1.1 304 Not Modified\r\nETag: %s\r\n'
+    'Connection: keep-alive\r\n\r\n' % DASHBOARD_ETAG
+).encode('latin-1')
+NOT_FOUND_RESP = _build_response('404 Not Found', 'text/html', NOT_FOUND_BYTES)
+
+# Header template for the metrics hot path; body length is the only
+# per-response variable.
+_METRICS_HEAD = (
+    b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+    b'Content-Length: %d\r\nConnection: keep-alive\r\n\r\n'
+)
+_METRICS_PACK_HEAD = (
+    b'HTTP/1.1 200 OK\r\nContent-Type: application/msgpack\r\n'
+    b'Content-Length: %d\r\nConnection: keep-alive\r\n\r\n'
+)
+# JSON served on the msgpack route when msgpack is not installed; the
+# header tells the client which encoding it actually got.
+_METRICS_PACK_FALLBACK_HEAD = (
+    b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+    b'X-Content-Fallback: json\r\n'
+    b'Content-Length: %d\r\nConnection: keep-alive\r\n\r\n'
+)
+
+# Flat (path, accepts_gzip) -> complete wire response table for the
+# immutable routes, plus per-path ETag/304 companions. Serving a static
+# page is one dict lookup and one write.
+_STATIC_RESP = {}
+_STATIC_ETAG = {}
+_STATIC_304 = {}
+for _path in ('/', '/dashboard'):
+    _STATIC_RESP[(_path, False)] = DASHBOARD_RESP
+    _STATIC_RESP[(_path, True)] = DASHBOARD_RESP_GZ
+    _STATIC_ETAG[_path] = DASHBOARD_ETAG
+    _STATIC_304[_path] = DASHBOARD_RESP_304
+del _path
+
+
+def _get_metrics_cache() -> dict:
+    """Get the metrics cache, refreshing it if the TTL has lapsed"""
+    global _metrics_fingerprint
+
+    now = time.monotonic()
+    if now - _metrics_cache['ts'] < _METRICS_CACHE_TTL:
+        return _metrics_cache
+
+    with _metrics_cache_lock:
+        # Re-check under the lock: another request may have refreshed
+        if now - _metrics_cache['ts'] < _METRICS_CACHE_TTL:
+            return _metrics_cache
+
+        metrics = {
+            'concepts_formed': 0,
+            'rules_learned': 0,
+            'transfers_made': 0,
+            'goals_generated': 0,
+            'total_observations': 0,
+            'uptime_seconds': 0,
+            'errors': 0,
+            'domains_tracked': 0,
+            'concepts': [],
+            'rules': [],
+            'transfers': [],
+            'goals': []
+        }
+
+        callback = DashboardHandler.metrics_callback
+        if callback:
+            try:
+                metrics = callback()
+            except Exception as e:
+                logger.debug(f"Metrics callback error: {e}")
+
+        # Bump the sequence only when the growing lists change, so
+        # up-to-date clients can be answered with the delta payload.
+        fingerprint = tuple(
+            len(metrics.get(k) or ()) for k in _METRICS_LIST_KEYS
+        )
+        if fingerprint != _metrics_fingerprint:
+            _metrics_fingerprint = fingerprint
+            _metrics_cache['seq'] += 1
+        metrics.setdefault('seq', _metrics_cache['seq'])
+
+        delta = dict(metrics)
+        for k in _METRICS_LIST_KEYS:
+            delta[k] = []
+
+        buf = _serialize_metrics(metrics)
+        delta_buf = _serialize_metrics(delta)
+        _metrics_cache['resp'] = _METRICS_HEAD % len(buf) + buf
+        _metrics_cache['delta_resp'] = (
+            _METRICS_HEAD % len(delta_buf) + delta_buf
+        )
+        if msgpack is not None:
+            packed = msgpack.packb(metrics, use_bin_type=True)
+            _metrics_cache['pack_resp'] = (
+                _METRICS_PACK_HEAD % len(packed) + packed
+            )
+        else:
+            _metrics_cache['pack_resp'] = (
+                _METRICS_PACK_FALLBACK_HEAD % len(buf) + buf
+            )
+        _metrics_cache['ts'] = now
+        return _metrics_cache
+
+
+def _serve_metrics(handler):
+    cache = _get_metrics_cache()
+    resp = cache['resp']
+    # A client that is already at the current sequence gets the payload
+    # without the (unchanged) list fields: O(1) bytes instead of O(N).
+    since = handler.query_params.get('since')
+    if since is not None and since == str(cache['seq']):
+        resp = cache['delta_resp']
+    handler.wfile.write(resp)
+
+
+def _serve_metrics_msgpack(handler):
+    handler.wfile.write(_get_metrics_cache()['pack_resp'])
+
+
+def _serve_404(handler):
+    handler.wfile.write(NOT_FOUND_RESP)
+
+
+# path -> handler function for the dynamic routes; static pages resolve
+# through _STATIC_RESP before this table is consulted.
+_HANDLERS = {
+    '/api/metrics': _serve_metrics,
+    '/api/metrics.msgpack': _serve_metrics_msgpack,
+}
+
+# Short-TTL cache for the serialized /api/metrics response. Every open
+# browser tab polls the endpoint every 2 seconds; coalescing bursts of
+# polls onto one callback + serialization keeps N tabs at O(1) cost.
+# 'delta' is the payload with the (unchanged) list fields stripped,
+# served to clients whose ?since= sequence is already current.
+_METRICS_CACHE_TTL = 0.5  # seconds
+_metrics_cache = {
+    'ts': 0.0, 'resp': b'', 'delta_resp': b'', 'pack_resp': b'', 'seq': 0
+}
+_metrics_cache_lock = threading.Lock()
+
+# List-valued metrics that grow over time; the delta protocol elides
+# them when the client is already up to date.
+_METRICS_LIST_KEYS = ('concepts', 'rules', 'transfers', 'goals')
+_metrics_fingerprint = None
+
+
+# Reusable encoder for the stdlib fallback: json.dumps builds a fresh
+# encoder per call. Compact separators shave whitespace off the payload;
+# check_circular is safe to drop because the metrics dict is built fresh
+# and acyclic on every callback.
+_JSON_ENCODER = json.JSONEncoder(
+    separators=(',', ':'), ensure_ascii=False, check_circular=False
+)
+
+
+def _serialize_metrics(metrics: dict) -> bytes:
+    """Serialize the metrics dict to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(metrics)
+    return _JSON_ENCODER.encode(metrics).encode('utf-8')
+
+
 class DashboardHandler(BaseHTTPRequestHandler):
     """HTTP request handler for dashboards"""
-    
+
+    # HTTP/1.1 enables keep-alive, so the 2-second metrics poll reuses
+    # one TCP connection per tab instead of handshaking on every fetch.
+    # Every response path must send Content-Length for this to hold.
+    protocol_version = 'HTTP/1.1'
+
+    # With the bounded worker pool, a keep-alive connection parks a
+    # worker for its whole lifetime; without a timeout, 16 idle tabs
+    # would starve the pool. 10s comfortably covers the 2-second poll
+    # interval while reclaiming workers from abandoned connections —
+    # a timed-out client simply reconnects on its next poll.
+    timeout = 10
+
     metrics_callback = None
     startup_logged = False
-    
+
+    def setup(self):
+        super().setup()
+        # Disable Nagle's algorithm: the small JSON responses otherwise
+        # risk sitting in the kernel waiting to be coalesced, inflating
+        # tail latency on the 2-second metrics poll.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def do_GET(self):
         """Handle GET requests"""
         if not DashboardHandler.startup_logged:
             logger.info("HTTP Dashboards Server is ONLINE")
             DashboardHandler.startup_logged = True
         
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        if path == '/' or path == '/dashboard':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(DASHBOARD_HTML.encode('utf-8'))
-        
-        elif path == '/api/metrics':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            
-            metrics = {
-                'concepts_formed': 0,
-                'rules_learned': 0,
-                'transfers_made': 0,
-                'goals_generated': 0,
-                'total_observations': 0,
-                'uptime_seconds': 0,
-                'errors': 0,
-                'domains_tracked': 0,
-                'concepts': [],
-                'rules': [],
-                'transfers': [],
-                'goals': []
-            }
-            
-            if self.metrics_callback:
-                try:
-                    metrics = self.metrics_callback()
-                except Exception as e:
-                    logger.debug(f"Metrics callback error: {e}")
-            
-            self.wfile.write(json.dumps(metrics).encode())
-        
+        # Strip any query string without paying for a full urlparse();
+        # only /api/metrics?since= reads parameters, and the common case
+        # carries none.
+        raw = self.path
+        q = raw.find('?')
+        if q < 0:
+            path = raw
+            self.query_params = {}
         else:
-            self.send_response(404)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(b"<h1>404 Not Found</h1>")
+            path = raw[:q]
+            self.query_params = {
+                k: v for k, _, v in
+                (part.partition('=') for part in raw[q + 1:].split('&'))
+            }
+
+        resp = _STATIC_RESP.get(
+            (path, 'gzip' in self.headers.get('Accept-Encoding', ''))
+        )
+        if resp is not None:
+            if self.headers.get('If-None-Match') == _STATIC_ETAG[path]:
+                resp = _STATIC_304[path]
+            self.wfile.write(resp)
+            return
+
+        handler = _HANDLERS.get(path)
+        if handler is None:
+            _serve_404(self)
+            return
+        handler(self)
     
     def log_message(self, format, *args):
         """Suppress default logging"""
         logger.debug(format % args)
 
 
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that handles requests on a bounded worker pool.
+
+    ThreadingHTTPServer spawns (and tears down) one thread per request,
+    which for an always-open dashboard polling every 2 seconds means a
+    steady churn of short-lived threads. A fixed pool amortizes thread
+    creation and bounds resource use under burst load while still
+    handling the HTML fetch and metrics poll concurrently.
+    """
+
+    pool_size = 16
+    # Deeper accept queue than socketserver's default of 5: a burst of
+    # reconnecting browser tabs after a restart should queue, not drop.
+    request_queue_size = 128
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.pool_size,
+            thread_name_prefix='dashboard-http'
+        )
+
+    def server_bind(self):
+        # SO_REUSEPORT (where available) lets multiple server processes
+        # share the port, one per core, for horizontal scaling.
+        if hasattr(socket, 'SO_REUSEPORT'):
+            try:
+                self.socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_REUSEPORT, 1
+                )
+            except OSError:
+                pass
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
 def start_http_dashboards(port: int = 8080, metrics_callback=None):
     """Start HTTP dashboards server in a background thread"""
     DashboardHandler.metrics_callback = metrics_callback
-    
-    server = HTTPServer(('0.0.0.0', port), DashboardHandler)
+
+    server = PooledHTTPServer(('0.0.0.0', port), DashboardHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     
     logger.info(f"✓ HTTP Dashboards started on port {port}")
     logger.info(f"  - Dashboard: http://0.0.0.0:{port}/")
     logger.info(f"  - Metrics API: http://0.0.0.0:{port}/api/metrics")
-    
+
     return server
+
+
+class _AsyncRequest:
+    """Adapts an asyncio connection to the interface the serve functions use"""
+
+    __slots__ = ('headers', 'query_params', 'wfile')
+
+    def __init__(self, headers: dict, query_params: dict, writer):
+        self.headers = headers
+        self.query_params = query_params
+        self.wfile = writer  # StreamWriter.write matches wfile.write
+
+
+async def _handle_async_client(reader, writer):
+    """Serve one keep-alive connection on the asyncio event loop"""
+    try:
+        while True:
+            try:
+                raw = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    ConnectionError):
+                break
+
+            lines = raw.decode('latin-1').split('\r\n')
+            parts = lines[0].split(' ')
+            if len(parts) < 2:
+                break
+            target = parts[1]
+
+            headers = {}
+            for line in lines[1:]:
+                key, sep, value = line.partition(':')
+                if sep:
+                    headers[key.title()] = value.strip()
+
+            q = target.find('?')
+            if q < 0:
+                path, params = target, {}
+            else:
+                path = target[:q]
+                params = {
+                    k: v for k, _, v in
+                    (part.partition('=') for part in target[q + 1:].split('&'))
+                }
+
+            resp = _STATIC_RESP.get(
+                (path, 'gzip' in headers.get('Accept-Encoding', ''))
+            )
+            if resp is not None:
+                if headers.get('If-None-Match') == _STATIC_ETAG[path]:
+                    resp = _STATIC_304[path]
+                writer.write(resp)
+            else:
+                handler = _HANDLERS.get(path, _serve_404)
+                handler(_AsyncRequest(headers, params, writer))
+            await writer.drain()
+
+            if headers.get('Connection', '').lower() == 'close':
+                break
+    finally:
+        writer.close()
+
+
+def start_http_dashboards_async(port: int = 8080, metrics_callback=None):
+    """Serve the dashboards from a single asyncio event loop.
+
+    Alternative to the thread-pool server for deployments with many
+    concurrent pollers: N persistent connections cost one task each
+    instead of one OS thread each. All responses are the same prebuilt
+    buffers the threaded path serves. Note the metrics callback runs on
+    the event loop, so it should be fast and non-blocking.
+    """
+    DashboardHandler.metrics_callback = metrics_callback
+
+    async def _main():
+        server = await asyncio.start_server(
+            _handle_async_client, '0.0.0.0', port
+        )
+        async with server:
+            await server.serve_forever()
+
+    thread = threading.Thread(
+        target=lambda: asyncio.run(_main()), daemon=True
+    )
+    thread.start()
+
+    logger.info(f"✓ HTTP Dashboards (asyncio) started on port {port}")
+    return thread
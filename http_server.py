@@ -3,13 +3,101 @@ HTTP Server for Market Consciousness Dashboards
 Serves alongside ZeroMQ network on separate port
 """
 import asyncio
+import gzip
+import hashlib
 import logging
+import multiprocessing
 import os
+import re
+import socket
+import tempfile
+from functools import partial
 from aiohttp import web
+from multidict import CIMultiDict, CIMultiDictProxy
 import json
 
+# Optional fast JSON serializer (C-implemented, several times faster
+# than stdlib for the small dict payloads the metrics endpoints serve)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: route the event loop through libuv. 2-4x throughput over the
+# default selector loop with no API changes; absent on Windows and when
+# uvloop is not installed, in which case the stdlib loop is used.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Optional binary metrics encoding: smaller payloads and cheaper decode
+# than JSON for machine consumers, negotiated via the Accept header.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional: vectorized waveform generation for the EEG stream. One
+# numpy.sin call per tick replaces an identical Math.sin loop running in
+# every open browser tab.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: precompiled template environment for server-side rendering.
+# Templates are compiled once at startup; compiling per render is the
+# classic render_template_string trap.
+try:
+    from jinja2 import Environment, DictLoader
+except ImportError:
+    Environment = None
+
 logger = logging.getLogger(__name__)
 
+# CSS shared by all three dashboard pages, served once at /static/app.css
+# with a long cache lifetime instead of being inlined into every HTML
+# payload. Page-specific rules stay in each template's own <style> block.
+SHARED_CSS = """\
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: 'IBM Plex Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    background: #000;
+    color: #fff;
+}
+.back-link {
+    display: inline-block;
+    color: #fff;
+    text-decoration: none;
+    border: 2px solid #fff;
+    padding: 0.5rem 1rem;
+    font-weight: 600;
+}
+.back-link:hover {
+    background: #fff;
+    color: #000;
+}
+.stat-label {
+    font-weight: 600;
+}
+.stat-value {
+    color: #0f0;
+    font-family: 'Courier New', monospace;
+    font-weight: 700;
+}
+"""
+SHARED_CSS_BYTES = SHARED_CSS.encode('utf-8')
+SHARED_CSS_GZ = gzip.compress(SHARED_CSS_BYTES, 9)
+# Content-addressed CSS URL: immutable caching is safe because the URL
+# changes with the content. /static/app.css stays as a plain alias.
+_CSS_HASH = hashlib.blake2b(SHARED_CSS_BYTES, digest_size=8).hexdigest()
+CSS_URL = f'/a/{_CSS_HASH}/app.css'
+# Sent on every HTML response so the browser starts the CSS fetch
+# before it has parsed the <link> tag.
+_CSS_PRELOAD = f'<{CSS_URL}>; rel=preload; as=style'
+
 # HTML Templates for dashboards
 INDEX_HTML = """
 <!DOCTYPE html>
@@ -18,12 +106,9 @@ INDEX_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Market Consciousness Hub</title>
+    <link rel="stylesheet" href="/static/app.css">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
         body {
-            font-family: 'IBM Plex Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: #000;
-            color: #fff;
             line-height: 1.6;
         }
         .container {
@@ -160,13 +245,8 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Market Consciousness Dashboard</title>
+    <link rel="stylesheet" href="/static/app.css">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: 'IBM Plex Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: #000;
-            color: #fff;
-        }
         .container {
             max-width: 1600px;
             margin: 0 auto;
@@ -200,14 +280,6 @@ DASHBOARD_HTML = """
             padding: 0.75rem 0;
             border-bottom: 1px solid #333;
         }
-        .stat-label {
-            font-weight: 600;
-        }
-        .stat-value {
-            color: #0f0;
-            font-family: 'Courier New', monospace;
-            font-weight: 700;
-        }
         .concept-list {
             margin-top: 1rem;
         }
@@ -219,17 +291,7 @@ DASHBOARD_HTML = """
             font-size: 0.9rem;
         }
         .back-link {
-            display: inline-block;
             margin-bottom: 2rem;
-            color: #fff;
-            text-decoration: none;
-            border: 2px solid #fff;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-        }
-        .back-link:hover {
-            background: #fff;
-            color: #000;
         }
     </style>
 </head>
@@ -280,22 +342,31 @@ DASHBOARD_HTML = """
     </div>
     
     <script>
-        async function updateMetrics() {
-            try {
-                const response = await fetch('/api/metrics');
-                const data = await response.json();
-                document.getElementById('concepts').textContent = data.concepts_formed || 0;
-                document.getElementById('rules').textContent = data.rules_learned || 0;
-                document.getElementById('transfers').textContent = data.transfers_made || 0;
-                document.getElementById('goals').textContent = data.goals_generated || 0;
-                document.getElementById('uptime').textContent = Math.floor(data.uptime_seconds || 0);
-            } catch (e) {
-                console.log('Metrics endpoint not available yet');
+        function applyMetrics(data) {
+            document.getElementById('concepts').textContent = data.concepts_formed || 0;
+            document.getElementById('rules').textContent = data.rules_learned || 0;
+            document.getElementById('transfers').textContent = data.transfers_made || 0;
+            document.getElementById('goals').textContent = data.goals_generated || 0;
+            document.getElementById('uptime').textContent = Math.floor(data.uptime_seconds || 0);
+        }
+
+        // One server-sent-events connection instead of a fetch every 2s;
+        // the server only pushes when the metrics actually change.
+        if (window.EventSource) {
+            const source = new EventSource('/api/metrics/stream');
+            source.onmessage = (ev) => applyMetrics(JSON.parse(ev.data));
+        } else {
+            async function updateMetrics() {
+                try {
+                    const response = await fetch('/api/metrics');
+                    applyMetrics(await response.json());
+                } catch (e) {
+                    console.log('Metrics endpoint not available yet');
+                }
             }
+            updateMetrics();
+            setInterval(updateMetrics, 2000);
         }
-        
-        updateMetrics();
-        setInterval(updateMetrics, 2000);
     </script>
 </body>
 </html>
@@ -308,11 +379,9 @@ EEG_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Market EEG Monitor</title>
+    <link rel="stylesheet" href="/static/app.css">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
         body {
-            font-family: 'IBM Plex Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: #000;
             color: #0f0;
             overflow: hidden;
         }
@@ -359,13 +428,9 @@ EEG_HTML = """
             top: 50%;
         }
         .back-link {
-            display: inline-block;
             margin: 1rem;
             color: #0f0;
-            text-decoration: none;
-            border: 2px solid #0f0;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
+            border-color: #0f0;
         }
         .back-link:hover {
             background: #0f0;
@@ -377,20 +442,25 @@ EEG_HTML = """
     <div class="container">
         <a href="/" class="back-link">← HOME</a>
         <h1>MARKET EEG MONITOR</h1>
-        <div class="eeg-container" id="eeg"></div>
+        <div class="eeg-container" id="eeg"><!-- EEG_ROWS --></div>
     </div>
-    
+
     <script>
-        const domains = ['stock:AAPL', 'stock:MSFT', 'stock:GOOGL', 'stock:TSLA', 'stock:NVDA', 'crypto:BTC', 'crypto:ETH'];
-        const eegContainer = document.getElementById('eeg');
-        
-        domains.forEach(domain => {
-            const wave = document.createElement('div');
-            wave.className = 'wave';
-            wave.innerHTML = `<div class="wave-label">${domain}</div><svg class="wave-line" style="stroke: #0f0; fill: none; stroke-width: 2"></svg>`;
-            eegContainer.appendChild(wave);
-        });
-        
+        const waveSvgs = document.querySelectorAll('.wave-line');
+
+        function drawWave(svg, samples, phase) {
+            const width = svg.parentElement.offsetWidth;
+            const height = svg.parentElement.offsetHeight;
+            const step = width / (samples.length - 1);
+            let d = '';
+            for (let i = 0; i < samples.length; i++) {
+                const y = height / 2 + samples[(i + phase) % samples.length] * (height / 3);
+                d += (i === 0 ? 'M ' : 'L ') + (i * step) + ' ' + y;
+            }
+            svg.setAttribute('d', d);
+        }
+
+        // Local fallback when the server cannot compute the waveform
         function generateWave(svg) {
             const width = svg.parentElement.offsetWidth;
             const height = svg.parentElement.offsetHeight;
@@ -402,25 +472,332 @@ EEG_HTML = """
             const pathData = points.map((p, i) => `${i === 0 ? 'M' : 'L'} ${p[0]} ${p[1]}`).join(' ');
             svg.setAttribute('d', pathData);
         }
-        
-        document.querySelectorAll('.wave-line').forEach(svg => {
-            setInterval(() => generateWave(svg), 50);
-        });
+
+        // Preferred path: the server computes one canonical waveform per
+        // tick and streams it as binary Float32 samples; each row just
+        // renders the shared buffer at a different phase offset.
+        let streaming = false;
+        try {
+            const ws = new WebSocket(`ws://${location.host}/ws/eeg`);
+            ws.binaryType = 'arraybuffer';
+            ws.onmessage = (ev) => {
+                streaming = true;
+                const samples = new Float32Array(ev.data);
+                waveSvgs.forEach((svg, idx) => drawWave(svg, samples, idx * 7));
+            };
+            ws.onclose = () => { streaming = false; };
+        } catch (e) {
+            streaming = false;
+        }
+
+        setInterval(() => {
+            if (!streaming) waveSvgs.forEach(generateWave);
+        }, 50);
     </script>
 </body>
 </html>
 """
 
+# Render the per-domain wave rows once at import time instead of DOM-building
+# them in JS on every page load; the repeated markup also gzips well.
+EEG_DOMAINS = (
+    'stock:AAPL', 'stock:MSFT', 'stock:GOOGL', 'stock:TSLA', 'stock:NVDA',
+    'crypto:BTC', 'crypto:ETH'
+)
+EEG_ROWS = ''.join(
+    f'<div class="wave"><div class="wave-label">{domain}</div>'
+    f'<svg class="wave-line" style="stroke: #0f0; fill: none; stroke-width: 2"></svg></div>'
+    for domain in EEG_DOMAINS
+)
+EEG_HTML = EEG_HTML.replace('<!-- EEG_ROWS -->', EEG_ROWS)
+
+# Point the pages at the content-addressed stylesheet URL so browsers
+# can cache it forever instead of revalidating the /static alias.
+INDEX_HTML = INDEX_HTML.replace('/static/app.css', CSS_URL)
+DASHBOARD_HTML = DASHBOARD_HTML.replace('/static/app.css', CSS_URL)
+EEG_HTML = EEG_HTML.replace('/static/app.css', CSS_URL)
+
+
+def _minify_html(html: str) -> str:
+    """Conservative whitespace minifier for the embedded templates.
+
+    Strips indentation, blank lines and HTML comments while keeping one
+    newline per remaining line, so the inline JS keeps its statement
+    boundaries. Gets most of what a real minifier would on these
+    templates without adding a dependency.
+    """
+    lines = (line.strip() for line in html.splitlines())
+    html = '\n'.join(line for line in lines if line)
+    return re.sub(r'<!--.*?-->', '', html, flags=re.S)
+
+
+def _build_asset(html: str) -> dict:
+    """Precompute body variants, ETag, content hash and frozen response
+    headers for a static template. Header multidicts are built once and
+    shared across requests (as read-only proxies) instead of being
+    re-allocated and re-sanitized per response.
+    """
+    raw = _minify_html(html).encode('utf-8')
+    gz = gzip.compress(raw, 9)
+    etag = '"' + hashlib.sha1(gz).hexdigest() + '"'
+    # Short content hash for fingerprinted URLs: the URL changes whenever
+    # the content does, so the copy can be cached forever.
+    content_hash = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    immutable = 'public, max-age=31536000, immutable'
+    return {
+        'raw': raw,
+        'gz': gz,
+        'etag': etag,
+        'hash': content_hash,
+        'gz_headers': CIMultiDictProxy(CIMultiDict({
+            'Content-Encoding': 'gzip',
+            'ETag': etag,
+            'Cache-Control': 'public, max-age=3600',
+            'Link': _CSS_PRELOAD,
+            'Vary': 'Accept-Encoding',
+        })),
+        'plain_headers': CIMultiDictProxy(CIMultiDict({
+            'ETag': etag,
+            'Cache-Control': 'public, max-age=3600',
+            'Link': _CSS_PRELOAD,
+            'Vary': 'Accept-Encoding',
+        })),
+        'not_modified_headers': CIMultiDictProxy(CIMultiDict({
+            'ETag': etag,
+        })),
+        'gz_immutable_headers': CIMultiDictProxy(CIMultiDict({
+            'Content-Encoding': 'gzip',
+            'Cache-Control': immutable,
+            'Link': _CSS_PRELOAD,
+            'Vary': 'Accept-Encoding',
+        })),
+        'plain_immutable_headers': CIMultiDictProxy(CIMultiDict({
+            'Cache-Control': immutable,
+            'Link': _CSS_PRELOAD,
+            'Vary': 'Accept-Encoding',
+        })),
+    }
+
+
+def export_static_site(dest: str = 'static') -> str:
+    """Write the minified templates (plus .gz variants) to dest.
+
+    For deployments that put a native front proxy (see Caddyfile) in
+    front of the aiohttp server: the proxy serves these files directly
+    and only forwards /api/* and /ws/* upstream, so Python never sees
+    static traffic.
+    """
+    os.makedirs(dest, exist_ok=True)
+    for name, asset in _ASSETS.items():
+        path = os.path.join(dest, f'{name}.html')
+        with open(path, 'wb') as fh:
+            fh.write(asset['raw'])
+        with open(path + '.gz', 'wb') as fh:
+            fh.write(asset['gz'])
+    css_path = os.path.join(dest, 'app.css')
+    with open(css_path, 'wb') as fh:
+        fh.write(SHARED_CSS_BYTES)
+    with open(css_path + '.gz', 'wb') as fh:
+        fh.write(gzip.compress(SHARED_CSS_BYTES, 9))
+    return dest
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize to JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+_TEMPLATES = {
+    'index': INDEX_HTML,
+    'dashboard': DASHBOARD_HTML,
+    'eeg': EEG_HTML,
+}
+
+# Templates are immutable, so compression and ETag computation happen once
+# at import instead of on every request: name -> (raw, gzipped, etag).
+_ASSETS = {name: _build_asset(html) for name, html in _TEMPLATES.items()}
+
+
+def _serve_asset(request, name: str) -> web.Response:
+    """Serve a precompressed static template with ETag revalidation"""
+    asset = _ASSETS[name]
+
+    if request.headers.get('If-None-Match') == asset['etag']:
+        return web.Response(status=304, headers=asset['not_modified_headers'])
+
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return web.Response(
+            body=asset['gz'],
+            content_type='text/html',
+            charset='utf-8',
+            headers=asset['gz_headers']
+        )
+
+    return web.Response(
+        body=asset['raw'],
+        content_type='text/html',
+        charset='utf-8',
+        headers=asset['plain_headers']
+    )
+
+
+def _serve_fingerprinted(request, name: str) -> web.Response:
+    """Serve a hash-addressed template copy with immutable caching.
+
+    The content hash is in the URL, so the browser never revalidates:
+    repeat visits to a bookmarked hashed URL skip the network entirely.
+    """
+    asset = _ASSETS[name]
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return web.Response(
+            body=asset['gz'],
+            content_type='text/html',
+            charset='utf-8',
+            headers=asset['gz_immutable_headers']
+        )
+    return web.Response(
+        body=asset['raw'],
+        content_type='text/html',
+        charset='utf-8',
+        headers=asset['plain_immutable_headers']
+    )
+
+
+# Frozen header maps for the non-asset hot paths, built once at import
+# instead of per response (web.Response otherwise allocates and
+# sanitizes a fresh headers dict every call).
+_JSON_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'Content-Type': 'application/json',
+}))
+_MSGPACK_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'Content-Type': 'application/msgpack',
+}))
+_CSS_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'Content-Type': 'text/css',
+    'Cache-Control': 'public, max-age=3600',
+}))
+_CSS_IMMUTABLE_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'Content-Type': 'text/css',
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'Vary': 'Accept-Encoding',
+}))
+_CSS_IMMUTABLE_GZ_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'Content-Type': 'text/css',
+    'Content-Encoding': 'gzip',
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'Vary': 'Accept-Encoding',
+}))
+
+
+# Configured Application instances keyed by metrics callback. Repeated
+# HTTPServer() construction with the same callback (reloads, tests,
+# extra workers in-process) reuses the routing trie instead of
+# rebuilding and re-registering every route.
+_APP_CACHE = {}
+
 
 class HTTPServer:
     """Async HTTP server for dashboards"""
-    
+
+    # TTL for the memoized metrics snapshot: bursts of requests from N
+    # open tabs within this window share one callback invocation and one
+    # serialization.
+    METRICS_TTL = 0.5  # seconds
+
+    # Canonical EEG waveform: sample count and tick interval matching the
+    # 50ms redraw cadence the page previously ran in JS.
+    EEG_WAVE_SAMPLES = 128
+    EEG_WAVE_INTERVAL = 0.05  # seconds
+
     def __init__(self, port: int = 8080, metrics_callback=None):
         self.port = port
         self.metrics_callback = metrics_callback
-        self.app = web.Application()
-        self.setup_routes()
-    
+        # /status reports constants fixed at construction, so its
+        # body is serialized exactly once
+        status = {
+            'status': 'online',
+            'zeromq_network': 'active',
+            'http_server': 'running',
+            'port': port
+        }
+        if orjson is not None:
+            pretty = orjson.dumps(status, option=orjson.OPT_INDENT_2)
+        else:
+            pretty = json.dumps(status, indent=2).encode('utf-8')
+        self._status_body = b'<pre>' + pretty + b'</pre>'
+        self._metrics_cache = (0.0, None)
+        self._metrics_version = None
+        self._metrics_lock = asyncio.Lock()
+        self._subscribers = set()
+        self._broadcaster = None
+        self._eeg_subscribers = set()
+        self._eeg_broadcaster = None
+        self._compiled_templates = {}
+        if Environment is not None:
+            env = Environment(
+                loader=DictLoader(_TEMPLATES),
+                auto_reload=False,
+                cache_size=-1
+            )
+            self._compiled_templates = {
+                name: env.get_template(name) for name in _TEMPLATES
+            }
+        # Reuse a previously configured (and frozen) Application for the
+        # same callback; handlers bound to different callbacks must not
+        # share one, since the routes close over this instance.
+        try:
+            cached = _APP_CACHE.get(metrics_callback)
+        except TypeError:  # unhashable callback
+            cached = None
+        if cached is not None:
+            self.app = cached
+            self.assets_dir = None
+        else:
+            self.assets_dir = self._write_asset_files()
+            self.app = web.Application()
+            self.setup_routes()
+            # Freeze before first use so dispatch runs on the finalized
+            # (immutable) router rather than the mutable variant.
+            self.app.freeze()
+            try:
+                _APP_CACHE[metrics_callback] = self.app
+            except TypeError:
+                pass
+
+    @staticmethod
+    def _write_asset_files() -> str:
+        """Materialize the templates (plus .gz variants) in a temp dir.
+
+        Files under /_assets are served by aiohttp's static handler,
+        which uses sendfile(2) where available so bytes move in kernel
+        space; the sibling .gz files let it answer gzip-capable clients
+        with the precompressed form. The primary routes keep the
+        in-memory precompressed path, which already avoids per-request
+        string handling without the stat calls file serving incurs.
+        """
+        assets_dir = tempfile.mkdtemp(prefix='market-dashboards-')
+        for name, html in _TEMPLATES.items():
+            path = os.path.join(assets_dir, f'{name}.html')
+            with open(path, 'wb') as fh:
+                fh.write(_ASSETS[name]['raw'])
+            with open(path + '.gz', 'wb') as fh:
+                fh.write(_ASSETS[name]['gz'])
+        return assets_dir
+
+    def render_page(self, name: str, **context) -> str:
+        """Render a template through the precompiled environment.
+
+        For pages that inline dynamic values server-side; static pages
+        should keep using the precompressed asset path. Falls back to
+        the raw template string when jinja2 is not installed.
+        """
+        template = self._compiled_templates.get(name)
+        if template is None:
+            return _TEMPLATES[name]
+        return template.render(**context)
+
     def setup_routes(self):
         """Setup HTTP routes"""
         self.app.router.add_get('/', self.handle_index)
@@ -428,48 +805,286 @@ class HTTPServer:
         self.app.router.add_get('/eeg', self.handle_eeg)
         self.app.router.add_get('/status', self.handle_status)
         self.app.router.add_get('/api/metrics', self.handle_metrics)
+        self.app.router.add_get('/api/metrics/stream', self.handle_metrics_stream)
+        self.app.router.add_get('/ws/eeg', self.handle_eeg_ws)
+        self.app.router.add_get('/static/app.css', self.handle_css)
+        self.app.router.add_get(CSS_URL, self.handle_css_immutable)
+        self.app.router.add_static('/_assets', self.assets_dir)
+        # Hash-fingerprinted copies cacheable forever; the URL itself
+        # changes when the template content changes.
+        for name, asset in _ASSETS.items():
+            self.app.router.add_get(
+                f"/a/{asset['hash']}/{name}.html",
+                partial(self._handle_fingerprinted, name)
+            )
     
+    async def _handle_fingerprinted(self, name, request):
+        """Serve one of the /a/{hash}/ asset copies"""
+        return _serve_fingerprinted(request, name)
+
     async def handle_index(self, request):
         """Serve index page"""
-        return web.Response(text=INDEX_HTML, content_type='text/html')
-    
+        return _serve_asset(request, 'index')
+
     async def handle_dashboard(self, request):
         """Serve consciousness dashboard"""
-        return web.Response(text=DASHBOARD_HTML, content_type='text/html')
-    
+        return _serve_asset(request, 'dashboard')
+
     async def handle_eeg(self, request):
         """Serve EEG monitor"""
-        return web.Response(text=EEG_HTML, content_type='text/html')
+        return _serve_asset(request, 'eeg')
+
+    async def handle_css(self, request):
+        """Serve the shared stylesheet with a long cache lifetime"""
+        return web.Response(body=SHARED_CSS_BYTES, headers=_CSS_HEADERS)
+
+    async def handle_css_immutable(self, request):
+        """Serve the content-addressed stylesheet copy, cacheable forever"""
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            return web.Response(
+                body=SHARED_CSS_GZ, headers=_CSS_IMMUTABLE_GZ_HEADERS
+            )
+        return web.Response(
+            body=SHARED_CSS_BYTES, headers=_CSS_IMMUTABLE_HEADERS
+        )
     
     async def handle_status(self, request):
-        """Serve status page"""
-        status = {
-            'status': 'online',
-            'zeromq_network': 'active',
-            'http_server': 'running',
-            'port': self.port
-        }
-        return web.Response(text=f"<pre>{json.dumps(status, indent=2)}</pre>", content_type='text/html')
-    
+        """Serve status page (body prebuilt at construction)"""
+        return web.Response(
+            body=self._status_body, content_type='text/html'
+        )
+
+    async def _get_metrics_snapshot(self) -> tuple:
+        """(json_bytes, msgpack_bytes) snapshot, memoized for METRICS_TTL.
+
+        Both encodings are produced from one callback invocation so the
+        binary variant shares the cache; msgpack_bytes is None when
+        msgpack is not installed.
+
+        A callback may return (version, metrics_dict) instead of a bare
+        dict: when the version has not advanced since the last refresh,
+        the cached bytes are reused without re-serializing, so repeat
+        polls between producer ticks do zero JSON work.
+        """
+        now = asyncio.get_event_loop().time()
+        ts, bodies = self._metrics_cache
+        if bodies and now - ts < self.METRICS_TTL:
+            return bodies
+
+        async with self._metrics_lock:
+            # Re-check: a concurrent request may have refreshed already
+            ts, bodies = self._metrics_cache
+            if bodies and now - ts < self.METRICS_TTL:
+                return bodies
+
+            if self.metrics_callback:
+                metrics = self.metrics_callback()
+            else:
+                metrics = {'status': 'metrics_unavailable'}
+            if isinstance(metrics, tuple) and len(metrics) == 2:
+                version, metrics = metrics
+                if version == self._metrics_version and bodies:
+                    # Producer has not ticked: refresh the timestamp and
+                    # keep the already-serialized bytes.
+                    self._metrics_cache = (now, bodies)
+                    return bodies
+                self._metrics_version = version
+            packed = None
+            if msgpack is not None:
+                packed = msgpack.packb(metrics, use_bin_type=True)
+            bodies = (_json_bytes(metrics), packed)
+            self._metrics_cache = (now, bodies)
+            return bodies
+
+    async def _get_metrics_bytes(self) -> bytes:
+        """Serialized JSON metrics snapshot, memoized for METRICS_TTL"""
+        return (await self._get_metrics_snapshot())[0]
+
     async def handle_metrics(self, request):
-        """Serve metrics as JSON"""
-        if self.metrics_callback:
-            metrics = self.metrics_callback()
-            return web.json_response(metrics)
-        return web.json_response({'status': 'metrics_unavailable'})
+        """Serve metrics as JSON, or msgpack when the client asks for it"""
+        json_body, pack_body = await self._get_metrics_snapshot()
+        if (pack_body is not None
+                and 'application/msgpack' in request.headers.get('Accept', '')):
+            return web.Response(body=pack_body, headers=_MSGPACK_HEADERS)
+        return web.Response(body=json_body, headers=_JSON_HEADERS)
     
-    async def start(self):
+    async def _broadcast_metrics(self):
+        """Single producer loop feeding every stream subscriber.
+
+        One snapshot/serialize/compare cycle per second regardless of
+        how many clients are connected; each subscriber just gets the
+        prebuilt frame bytes pushed onto its queue. Exits when the last
+        subscriber disconnects.
+        """
+        last = None
+        while self._subscribers:
+            body = await self._get_metrics_bytes()
+            if body != last:
+                frame = b'data: ' + body + b'\n\n'
+                for queue in list(self._subscribers):
+                    queue.put_nowait(frame)
+                last = body
+            await asyncio.sleep(1)
+        self._broadcaster = None
+
+    async def handle_metrics_stream(self, request):
+        """Push metrics to the client over server-sent events.
+
+        Replaces the 2-second polling loop: each tab holds one
+        persistent connection and only receives bytes when the payload
+        actually changes. All connections are fed by the shared
+        _broadcast_metrics task rather than running their own
+        fetch/compare loops.
+        """
+        resp = web.StreamResponse(
+            headers={
+                'Content-Type': 'text/event-stream',
+                'Cache-Control': 'no-cache',
+            }
+        )
+        await resp.prepare(request)
+        self._raise_write_buffer(request)
+
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        if self._broadcaster is None:
+            self._broadcaster = asyncio.get_event_loop().create_task(
+                self._broadcast_metrics()
+            )
+        try:
+            while True:
+                frame = await queue.get()
+                # Coalesce frames that queued up while this client was
+                # slow into a single write/syscall.
+                while not queue.empty():
+                    frame += queue.get_nowait()
+                await resp.write(frame)
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscribers.discard(queue)
+        return resp
+
+    async def _broadcast_eeg_wave(self):
+        """Compute the canonical EEG waveform once per tick for all tabs.
+
+        A single vectorized numpy.sin call replaces the identical
+        Math.sin loop that previously ran 7 times per 50ms in every
+        open browser. The packed Float32 frame is shared by all
+        subscriber queues. Exits when the last socket disconnects.
+        """
+        t = np.arange(self.EEG_WAVE_SAMPLES, dtype=np.float32)
+        while self._eeg_subscribers:
+            now = asyncio.get_event_loop().time()
+            frame = np.sin(t / 3.0 + now * 2.0).astype(np.float32).tobytes()
+            for queue in list(self._eeg_subscribers):
+                queue.put_nowait(frame)
+            await asyncio.sleep(self.EEG_WAVE_INTERVAL)
+        self._eeg_broadcaster = None
+
+    async def handle_eeg_ws(self, request):
+        """Stream the EEG waveform as binary Float32 WebSocket frames"""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._raise_write_buffer(request)
+
+        if np is None:
+            # Without numpy the server-side computation would just be a
+            # Python loop per tick; close and let the page's local
+            # fallback animate instead.
+            await ws.close()
+            return ws
+
+        queue = asyncio.Queue()
+        self._eeg_subscribers.add(queue)
+        if self._eeg_broadcaster is None:
+            self._eeg_broadcaster = asyncio.get_event_loop().create_task(
+                self._broadcast_eeg_wave()
+            )
+        try:
+            while not ws.closed:
+                await ws.send_bytes(await queue.get())
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            self._eeg_subscribers.discard(queue)
+        return ws
+
+    @staticmethod
+    def _tune_listen_sockets(site):
+        """Disable Nagle and enable TCP keepalive on the listen sockets.
+
+        Accepted connections inherit both options, so small metric
+        replies go out immediately instead of waiting on the
+        Nagle/delayed-ACK interaction, and idle dashboard connections
+        are kept from being silently dropped by middleboxes. The 1 MiB
+        send/receive buffers let the kernel batch the 20Hz stream
+        writes instead of waking the loop per small chunk.
+        """
+        server = getattr(site, '_server', None)
+        if server is None or not server.sockets:
+            return
+        for sock in server.sockets:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _raise_write_buffer(request):
+        """Widen the asyncio write buffer on a streaming connection so
+        the transport drains in larger batches with fewer wakeups"""
+        transport = request.transport
+        if transport is not None:
+            transport.set_write_buffer_limits(high=1 << 20)
+
+    async def start(self, reuse_port: bool = False):
         """Start the HTTP server"""
-        runner = web.AppRunner(self.app)
+        # Long keepalive so pollers reuse one connection across many
+        # request cycles instead of paying a handshake per poll.
+        runner = web.AppRunner(self.app, keepalive_timeout=75)
         await runner.setup()
-        site = web.TCPSite(runner, '0.0.0.0', self.port)
+        site = web.TCPSite(
+            runner, '0.0.0.0', self.port,
+            reuse_address=True, reuse_port=reuse_port
+        )
         await site.start()
+        self._tune_listen_sockets(site)
         logger.info(f"HTTP Server started on port {self.port}")
         return runner
 
 
-async def start_http_server(port: int = 8080, metrics_callback=None):
-    """Start HTTP server for dashboards"""
+def _run_worker(port: int, metrics_callback):
+    """Entry point for one extra HTTP worker process sharing the port"""
+    async def _main():
+        server = HTTPServer(port=port, metrics_callback=metrics_callback)
+        await server.start(reuse_port=True)
+        await asyncio.Event().wait()
+
+    asyncio.run(_main())
+
+
+async def start_http_server(port: int = 8080, metrics_callback=None,
+                            workers: int = 1):
+    """Start HTTP server for dashboards.
+
+    With workers > 1, additional processes are spawned binding the same
+    port via SO_REUSEPORT; the kernel load-balances incoming connections
+    across them, sidestepping the single event loop (and the GIL) for
+    JSON encoding and metrics aggregation. The callback must be
+    picklable to cross the process boundary.
+    """
+    if workers > 1:
+        for _ in range(workers - 1):
+            multiprocessing.Process(
+                target=_run_worker,
+                args=(port, metrics_callback),
+                daemon=True
+            ).start()
+
     server = HTTPServer(port=port, metrics_callback=metrics_callback)
-    runner = await server.start()
+    runner = await server.start(reuse_port=workers > 1)
     return runner
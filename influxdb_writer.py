@@ -2,18 +2,198 @@
 InfluxDB Time-Series Storage Integration
 Stores market data, simulation states, and portfolio metrics for analysis
 """
+import asyncio
+import heapq
 import logging
-from datetime import datetime
+import math
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 import os
 from influxdb_client import InfluxDBClient, Point, WritePrecision, WriteOptions
 from influxdb_client.client.write_api import SYNCHRONOUS, ASYNCHRONOUS
+
+# Optional: flush in a child process so batching/retry work never
+# contends with the caller's threads for the GIL (older client versions
+# don't ship it)
+try:
+    from influxdb_client.client.util.multiprocessing_helper import (
+        MultiprocessingWriter,
+    )
+except ImportError:
+    MultiprocessingWriter = None
 import threading
+import time
 import queue
+import weakref
+
+# Optional: asyncio-native HTTP client for AsyncInfluxDBWriter
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: vectorized aggregation over query results
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: columnar query results via query_data_frame — one bulk
+# parse into a DataFrame instead of a Python object per row
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_ts_ns(timestamp) -> int:
+    """Resolve a caller-supplied timestamp to integer nanoseconds.
+
+    The default is time.time_ns() — no datetime allocation, and
+    datetime.utcnow() is deprecated since 3.12. Datetimes from older
+    callers are converted, with naive ones treated as UTC to match the
+    client's own convention; ints pass through.
+    """
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return int(timestamp.timestamp() * 1e9)
+    return int(timestamp)
+
+
+@lru_cache(maxsize=65536)
+def _market_tag_suffix(source: str, symbol: str) -> str:
+    """Cached ',source=...,symbol=...' line-protocol fragment.
+
+    The same handful of (source, symbol) pairs recurs every tick, so
+    after the first occurrence the escape work is a dict hit.
+    Keys are emitted pre-sorted as line protocol expects.
+    """
+    return f',source={_esc_tag(source)},symbol={_esc_tag(symbol)}'
+
+
+# Precompiled per-measurement line templates, tags in sorted order.
+# The "format plan" is shared across calls; per-call work is just value
+# substitution, skipping Point allocation and attribute chaining.
+_TMPL_SENTIMENT = (
+    'sentiment,crypto_label={crypto_label},equity_label={equity_label} '
+    'equity_fg={equity_fg},crypto_fg={crypto_fg},'
+    'equity_fg_norm={equity_fg_norm},crypto_fg_norm={crypto_fg_norm},'
+    'sentiment_bias={sentiment_bias} {ts}'
+)
+_TMPL_TRADE = (
+    'trade,action={action}{reason_tag},symbol={symbol} '
+    'quantity={quantity},price={price},value={value}{extra} {ts}'
+)
+_TMPL_PERFORMANCE = (
+    'performance sharpe_ratio={sharpe_ratio},max_drawdown={max_drawdown},'
+    'win_rate={win_rate},total_trades={total_trades},'
+    'winning_trades={winning_trades},losing_trades={losing_trades},'
+    'total_pnl={total_pnl} {ts}'
+)
+_TMPL_HEALTH = (
+    'system_health,component={component} '
+    'is_healthy={is_healthy},error_count={error_count}{extra} {ts}'
+)
+
+
+# Flux query texts are constants with bind parameters instead of
+# per-call f-string interpolation: the server sees one stable query
+# text it can parse/plan-cache, and values can't inject Flux syntax.
+_RECENT_PRICES_FLUX = '''
+from(bucket: _bucket)
+    |> range(start: _start)
+    |> filter(fn: (r) => r["_measurement"] == "market_data")
+    |> filter(fn: (r) => r["symbol"] == _symbol)
+    |> filter(fn: (r) => r["_field"] == "price")
+'''
+
+_PORTFOLIO_FLUX = '''
+from(bucket: _bucket)
+    |> range(start: _start)
+    |> filter(fn: (r) => r["_measurement"] == "portfolio")
+    |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+
+_WINDOW_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days',
+                 'w': 'weeks'}
+
+
+def _window_start(window: str) -> timedelta:
+    """Convert a duration string like "1h" or "24h" to the negative
+    timedelta the parameterized range start expects"""
+    unit = _WINDOW_UNITS[window[-1]]
+    return -timedelta(**{unit: int(window[:-1])})
+
+
+def _safe_close(write_api):
+    """Best-effort write API shutdown for weakref.finalize; never raises
+    (it may run during interpreter shutdown)"""
+    try:
+        write_api.close()
+    except Exception:
+        pass
+
+
+def _esc_tag(value: str) -> str:
+    """Escape a tag key/value per the line-protocol rules"""
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace(',', '\\,')
+        .replace(' ', '\\ ')
+        .replace('=', '\\=')
+    )
+
+
+# numpy scalars must map to the same line-protocol types as their
+# Python counterparts: np.int64 is not an int subclass (a quoted field
+# causes a type conflict that rejects the whole batch), and under
+# numpy>=2 repr(np.float64(1.5)) is 'np.float64(1.5)'.
+_BOOL_TYPES = (bool,) if np is None else (bool, np.bool_)
+_INT_TYPES = (int,) if np is None else (int, np.integer)
+_FLOAT_TYPES = (float,) if np is None else (float, np.floating)
+
+
+def _lp_field(value) -> str:
+    """Format one field value with the same typing Point would infer"""
+    if isinstance(value, _BOOL_TYPES):
+        return 'true' if value else 'false'
+    if isinstance(value, _INT_TYPES):
+        return f'{int(value)}i'
+    if isinstance(value, _FLOAT_TYPES):
+        return repr(float(value))
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _lp(measurement: str, tags: Dict[str, str], fields: Dict[str, Any],
+        ts_ns: int) -> str:
+    """Build one line-protocol entry directly.
+
+    Skips the Point builder's per-call tag sort, escape and field-type
+    inference — the dominant per-point cost in the loop-heavy writers.
+    """
+    tag_str = ''.join(
+        f',{_esc_tag(k)}={_esc_tag(v)}' for k, v in sorted(tags.items())
+    )
+    field_str = ','.join(f'{k}={_lp_field(v)}' for k, v in fields.items())
+    return f'{measurement}{tag_str} {field_str} {ts_ns}'
+
+
+# One InfluxDBClient (and its urllib3 connection pool) per
+# (url, token, org), shared by every writer so components each holding
+# a writer reuse connections instead of fragmenting the pool and paying
+# TCP/TLS handshakes per instance.
+_CLIENTS: Dict[tuple, InfluxDBClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
 class InfluxDBWriter:
     """High-performance time-series data writer for InfluxDB"""
     
@@ -25,11 +205,12 @@ class InfluxDBWriter:
         bucket: Optional[str] = None,
         batch_size: int = 1000,
         flush_interval: int = 10000,  # milliseconds
-        async_mode: bool = True
+        async_mode: bool = True,
+        expected_rate_hz: Optional[float] = None
     ):
         """
         Initialize InfluxDB writer
-        
+
         Args:
             url: InfluxDB URL (default from INFLUXDB_URL env var)
             token: Auth token (default from INFLUXDB_TOKEN env var)
@@ -38,43 +219,163 @@ class InfluxDBWriter:
             batch_size: Points per batch for async writes
             flush_interval: Flush interval in ms
             async_mode: Use async writes for better performance
+            expected_rate_hz: Anticipated points/sec; when given,
+                batch_size and flush_interval are derived from it
         """
         self.url = url or os.getenv('INFLUXDB_URL', 'http://localhost:8086')
         self.token = token or os.getenv('INFLUXDB_TOKEN')
         self.org = org or os.getenv('INFLUXDB_ORG', 'market-system')
         self.bucket = bucket or os.getenv('INFLUXDB_BUCKET', 'market-data')
-        
+        self.batch_size = int(os.getenv('INFLUXDB_BATCH_SIZE', batch_size))
+        self.flush_interval = int(
+            os.getenv('INFLUXDB_FLUSH_INTERVAL', flush_interval)
+        )
+
+        if expected_rate_hz:
+            # Ski-rental style timer: with a fixed flush cost F0, the
+            # optimal hold time is T* = sqrt(2*F0/rate). Low-rate streams
+            # get a short timer bounding tail latency; high-rate streams
+            # push the timer toward vacuous and let batch_size govern.
+            f0_s = 0.005  # approximate fixed cost of one flush
+            self.flush_interval = max(50, int(
+                1000 * math.sqrt(2 * f0_s / max(expected_rate_hz, 1e-3))
+            ))
+            self.batch_size = max(500, int(
+                expected_rate_hz * self.flush_interval / 1000
+            ))
+            logger.info(
+                f"Batching tuned for {expected_rate_hz:.0f} points/s: "
+                f"batch_size={self.batch_size}, "
+                f"flush_interval={self.flush_interval}ms"
+            )
+
         if not self.token:
             raise ValueError("InfluxDB token not provided")
         
-        # Initialize client
-        self.client = InfluxDBClient(
-            url=self.url,
-            token=self.token,
-            org=self.org
+        # Initialize client (shared across writer instances)
+        self.client = self.get_shared_client(self.url, self.token, self.org)
+
+        # Backpressure: producers block in _write_point once this many
+        # points are buffered or in flight, instead of the write queue
+        # growing without bound when the network falls behind.
+        self.max_inflight_points = int(
+            os.getenv('INFLUXDB_MAX_INFLIGHT', self.batch_size * 4)
         )
-        
+        self._sem = threading.BoundedSemaphore(self.max_inflight_points)
+        # Serializes multi-permit acquisition in _write_records so two
+        # producers can never each hold part of the capacity while
+        # waiting on the other's unbuffered remainder.
+        self._admit_lock = threading.Lock()
+
+        # When the write commits inline (sync or multiprocessing IPC),
+        # release semaphore capacity right after write() returns; the
+        # in-process batching API releases from its callbacks instead.
+        self._release_inline = not async_mode
+
         # Initialize write API
         if async_mode:
             write_options = WriteOptions(
-                batch_size=batch_size,
-                flush_interval=flush_interval,
+                batch_size=self.batch_size,
+                flush_interval=self.flush_interval,
                 jitter_interval=2000,
                 retry_interval=5000,
                 max_retries=3
             )
-            self.write_api = self.client.write_api(write_options=write_options)
+            if MultiprocessingWriter is not None and os.getenv('INFLUXDB_MP_WRITER'):
+                # Latency-sensitive callers: batching and retries run in
+                # a child process, so flushes never contend with the
+                # caller for the GIL — the parent only IPCs the records.
+                self.write_api = MultiprocessingWriter(
+                    url=self.url,
+                    token=self.token,
+                    org=self.org,
+                    write_options=write_options
+                )
+                self.write_api.start()
+                self._release_inline = True
+            else:
+                self.write_api = self.client.write_api(
+                    write_options=write_options,
+                    success_callback=self._on_write_success,
+                    error_callback=self._on_write_error
+                )
         else:
             self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
         
         self.query_api = self.client.query_api()
-        
+
+        # Local point buffer: write_* helpers append here and whole
+        # batches are handed to the client in one write() call, instead
+        # of paying the client's per-point serialization, locking and
+        # enqueue overhead on every helper call.
+        self._buf: List[Point] = []
+        self._buf_lock = threading.Lock()
+        # Arrival tracking for the adaptive flush timer (_flush_loop)
+        self._arrivals = 0
+        self._lambda_ewma = 0.0
+        self._closed = False
+        self._flush_event = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, daemon=True, name='influxdb-flusher'
+        )
+        self._flusher.start()
+
+        # Backstop cleanup that cannot raise during shutdown; explicit
+        # close() (or the context manager) remains the intended path.
+        self._finalizer = weakref.finalize(self, _safe_close, self.write_api)
+
         logger.info(
             f"InfluxDB client initialized: {self.url} | "
             f"Org: {self.org} | Bucket: {self.bucket} | "
             f"Mode: {'async' if async_mode else 'sync'}"
         )
     
+    @classmethod
+    def get_shared_client(cls, url: str, token: str, org: str) -> InfluxDBClient:
+        """Return the pooled client for (url, token, org), creating it
+        on first use. The client stays open for the process lifetime;
+        writer close() only shuts down the per-writer write API.
+        """
+        key = (url, token, org)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                # Line protocol is highly repetitive (measurement and
+                # tag keys recur every line), so gzip typically shrinks
+                # batch bodies 5-10x; with local buffering batches stay
+                # well above the size where compression pays off.
+                client = InfluxDBClient(
+                    url=url, token=token, org=org, pool_size=32,
+                    enable_gzip=True
+                )
+                _CLIENTS[key] = client
+        return client
+
+    def format_market_data(
+        self,
+        symbol: str,
+        price: float,
+        volume: float,
+        source: str,
+        sentiment: Optional[float] = None,
+        timestamp: Optional[datetime] = None
+    ) -> str:
+        """Build the line-protocol record for a market data point.
+
+        Callers that collect a whole iteration's worth of records can
+        format each one here and submit them together via write_batch.
+        """
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        fields = f'price={_lp_field(price)},volume={_lp_field(volume)}'
+        if sentiment is not None:
+            fields += f',sentiment={_lp_field(sentiment)}'
+
+        return (
+            f'market_data{_market_tag_suffix(source, symbol)}'
+            f' {fields} {ts_ns}'
+        )
+
     def write_market_data(
         self,
         symbol: str,
@@ -85,21 +386,57 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write market data point"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        point = (
-            Point("market_data")
-            .tag("symbol", symbol)
-            .tag("source", source)
-            .field("price", price)
-            .field("volume", volume)
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        if sentiment is not None:
-            point.field("sentiment", sentiment)
-        
-        self._write_point(point)
+        self._write_point(self.format_market_data(
+            symbol, price, volume, source, sentiment, timestamp
+        ))
+
+    def write_market_data_batch(
+        self,
+        symbols,
+        prices,
+        volumes,
+        sentiments=None,
+        source: str = 'polygon',
+        ts_ns: Optional[int] = None
+    ):
+        """Write market data from parallel sequences (SoA layout).
+
+        Columnar sibling of write_market_data in the same mould as
+        write_agent_prices_bulk: one comprehension over zipped columns
+        replaces a kwargs dict and a buffer hand-off per point. Accepts
+        lists or numpy arrays; a None entry in sentiments drops the
+        field for that point.
+        """
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+
+        if sentiments is None:
+            lines = [
+                f'market_data{_market_tag_suffix(source, s)}'
+                f' price={_lp_field(float(p))},volume={_lp_field(int(v))}'
+                f' {ts_ns}'
+                for s, p, v in zip(symbols, prices, volumes)
+            ]
+        else:
+            lines = [
+                f'market_data{_market_tag_suffix(source, s)}'
+                f' price={_lp_field(float(p))},volume={_lp_field(int(v))}'
+                + (f',sentiment={_lp_field(float(sn))}'
+                   if sn is not None else '')
+                + f' {ts_ns}'
+                for s, p, v, sn in zip(symbols, prices, volumes, sentiments)
+            ]
+
+        self._write_records(lines)
+
+    def write_batch(self, records: list):
+        """Submit a pre-built batch of records in one call.
+
+        Accepts line-protocol strings (from format_market_data and
+        friends) or Point objects; the whole batch goes through a
+        single buffer/lock round-trip instead of one per record.
+        """
+        self._write_records(records)
     
     def write_sentiment(
         self,
@@ -110,21 +447,20 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write sentiment indicators"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        point = (
-            Point("sentiment")
-            .tag("equity_label", equity_label)
-            .tag("crypto_label", crypto_label)
-            .field("equity_fg", equity_fg)
-            .field("crypto_fg", crypto_fg)
-            .field("equity_fg_norm", equity_fg / 100.0)
-            .field("crypto_fg_norm", crypto_fg / 100.0)
-            .field("sentiment_bias", (equity_fg * 0.6 + crypto_fg * 0.4) / 100.0)
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        self._write_point(point)
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        self._write_point(_TMPL_SENTIMENT.format(
+            crypto_label=_esc_tag(crypto_label),
+            equity_label=_esc_tag(equity_label),
+            equity_fg=_lp_field(equity_fg),
+            crypto_fg=_lp_field(crypto_fg),
+            equity_fg_norm=_lp_field(equity_fg / 100.0),
+            crypto_fg_norm=_lp_field(crypto_fg / 100.0),
+            sentiment_bias=_lp_field(
+                (equity_fg * 0.6 + crypto_fg * 0.4) / 100.0
+            ),
+            ts=ts_ns
+        ))
     
     def write_portfolio_state(
         self,
@@ -132,37 +468,31 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write portfolio state snapshot"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        # Main portfolio point
-        point = (
-            Point("portfolio")
-            .field("capital", portfolio_state.get('capital', 0))
-            .field("total_value", portfolio_state.get('total_value', 0))
-            .field("closed_pnl", portfolio_state.get('closed_pnl', 0))
-            .field("unrealized_pnl", portfolio_state.get('unrealized_pnl', 0))
-            .field("total_pnl", portfolio_state.get('total_pnl', 0))
-            .field("return_pct", portfolio_state.get('return_pct', 0))
-            .field("positions_count", portfolio_state.get('positions_count', 0))
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        self._write_point(point)
-        
-        # Individual positions
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        # Portfolio snapshot plus all positions as pre-serialized line
+        # protocol, submitted as a single batch
+        lines = [_lp('portfolio', {}, {
+            'capital': portfolio_state.get('capital', 0),
+            'total_value': portfolio_state.get('total_value', 0),
+            'closed_pnl': portfolio_state.get('closed_pnl', 0),
+            'unrealized_pnl': portfolio_state.get('unrealized_pnl', 0),
+            'total_pnl': portfolio_state.get('total_pnl', 0),
+            'return_pct': portfolio_state.get('return_pct', 0),
+            'positions_count': portfolio_state.get('positions_count', 0),
+        }, ts_ns)]
+
         positions = portfolio_state.get('positions', {})
         for symbol, pos_data in positions.items():
-            pos_point = (
-                Point("position")
-                .tag("symbol", symbol)
-                .field("quantity", pos_data.get('quantity', 0))
-                .field("entry_price", pos_data.get('entry_price', 0))
-                .field("current_price", pos_data.get('current_price', 0))
-                .field("unrealized_pnl", pos_data.get('unrealized_pnl', 0))
-                .field("pnl_pct", pos_data.get('pnl_pct', 0))
-                .time(timestamp, WritePrecision.NS)
-            )
-            self._write_point(pos_point)
+            lines.append(_lp('position', {'symbol': symbol}, {
+                'quantity': pos_data.get('quantity', 0),
+                'entry_price': pos_data.get('entry_price', 0),
+                'current_price': pos_data.get('current_price', 0),
+                'unrealized_pnl': pos_data.get('unrealized_pnl', 0),
+                'pnl_pct': pos_data.get('pnl_pct', 0),
+            }, ts_ns))
+
+        self._write_records(lines)
     
     def write_trade(
         self,
@@ -175,24 +505,18 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write trade execution"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        point = (
-            Point("trade")
-            .tag("symbol", symbol)
-            .tag("action", action)
-            .field("quantity", quantity)
-            .field("price", price)
-            .field("value", quantity * price)
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        if pnl is not None:
-            point.field("pnl", pnl)
-        if reason:
-            point.tag("reason", reason)
-        
-        self._write_point(point)
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        self._write_point(_TMPL_TRADE.format(
+            action=_esc_tag(action),
+            reason_tag=f',reason={_esc_tag(reason)}' if reason else '',
+            symbol=_esc_tag(symbol),
+            quantity=_lp_field(quantity),
+            price=_lp_field(price),
+            value=_lp_field(quantity * price),
+            extra=f',pnl={_lp_field(pnl)}' if pnl is not None else '',
+            ts=ts_ns
+        ))
     
     def write_simulation_state(
         self,
@@ -203,55 +527,88 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write simulation state"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        # Global simulation state
-        point = (
-            Point("simulation")
-            .field("step", step)
-            .field("global_state", global_state)
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        self._write_point(point)
-        
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        # Global state plus sampled agents as pre-serialized line
+        # protocol, submitted as a single batch
+        lines = [_lp('simulation', {}, {
+            'step': step,
+            'global_state': global_state,
+        }, ts_ns)]
+
         # Individual agent states (sample to avoid overwhelming)
         if agent_prices:
-            # Write only top N agents or sample
-            for security_id, price in list(agent_prices.items())[:100]:
-                agent_point = (
-                    Point("agent_price")
-                    .tag("security_id", security_id)
-                    .field("price", price)
-                    .time(timestamp, WritePrecision.NS)
+            signals = signals or {}
+            # Keep the 100 agents deviating most from the global state
+            # instead of whatever 100 happen to come first in insertion
+            # order; nlargest runs a bounded heap over the iterator, no
+            # full list copy.
+            if len(agent_prices) > 100:
+                sampled = heapq.nlargest(
+                    100, agent_prices.items(),
+                    key=lambda kv: abs(kv[1] - global_state)
                 )
-                
-                if signals and security_id in signals:
-                    agent_point.tag("signal", signals[security_id])
-                
-                self._write_point(agent_point)
+            else:
+                sampled = agent_prices.items()
+            for security_id, price in sampled:
+                tags = {'security_id': security_id}
+                signal = signals.get(security_id)
+                if signal is not None:
+                    tags['signal'] = signal
+                lines.append(_lp('agent_price', tags, {'price': price}, ts_ns))
+
+        self._write_records(lines)
     
+    def write_agent_prices_bulk(
+        self,
+        security_ids,
+        prices,
+        signals=None,
+        ts_ns: Optional[int] = None
+    ):
+        """Write agent prices from parallel sequences (SoA layout).
+
+        For callers that already hold agent state columnar (numpy
+        arrays or plain lists): one comprehension over zipped columns
+        replaces the per-entry dict and Point allocations that
+        write_simulation_state pays when fed a dict.
+        """
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+
+        if signals is None:
+            lines = [
+                f'agent_price,security_id={_esc_tag(s)}'
+                f' price={_lp_field(float(p))} {ts_ns}'
+                for s, p in zip(security_ids, prices)
+            ]
+        else:
+            lines = [
+                f'agent_price,security_id={_esc_tag(s)},signal={_esc_tag(g)}'
+                f' price={_lp_field(float(p))} {ts_ns}'
+                for s, p, g in zip(security_ids, prices, signals)
+            ]
+
+        self._write_records(lines)
+
     def write_performance_metrics(
         self,
         metrics: dict,
         timestamp: Optional[datetime] = None
     ):
         """Write performance metrics"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        point = (
-            Point("performance")
-            .field("sharpe_ratio", metrics.get('sharpe_ratio', 0))
-            .field("max_drawdown", metrics.get('max_drawdown', 0))
-            .field("win_rate", metrics.get('win_rate', 0))
-            .field("total_trades", metrics.get('total_trades', 0))
-            .field("winning_trades", metrics.get('winning_trades', 0))
-            .field("losing_trades", metrics.get('losing_trades', 0))
-            .field("total_pnl", metrics.get('total_pnl', 0))
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        self._write_point(point)
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        self._write_point(_TMPL_PERFORMANCE.format(
+            sharpe_ratio=_lp_field(metrics.get('sharpe_ratio', 0)),
+            max_drawdown=_lp_field(metrics.get('max_drawdown', 0)),
+            win_rate=_lp_field(metrics.get('win_rate', 0)),
+            total_trades=_lp_field(metrics.get('total_trades', 0)),
+            winning_trades=_lp_field(metrics.get('winning_trades', 0)),
+            losing_trades=_lp_field(metrics.get('losing_trades', 0)),
+            total_pnl=_lp_field(metrics.get('total_pnl', 0)),
+            ts=ts_ns
+        ))
     
     def write_system_health(
         self,
@@ -262,31 +619,141 @@ class InfluxDBWriter:
         timestamp: Optional[datetime] = None
     ):
         """Write system health metrics"""
-        timestamp = timestamp or datetime.utcnow()
-        
-        point = (
-            Point("system_health")
-            .tag("component", component)
-            .field("is_healthy", 1 if is_healthy else 0)
-            .field("error_count", error_count)
-            .time(timestamp, WritePrecision.NS)
-        )
-        
-        if latency_ms is not None:
-            point.field("latency_ms", latency_ms)
-        
-        self._write_point(point)
+        ts_ns = _resolve_ts_ns(timestamp)
+
+        self._write_point(_TMPL_HEALTH.format(
+            component=_esc_tag(component),
+            is_healthy=_lp_field(1 if is_healthy else 0),
+            error_count=_lp_field(error_count),
+            extra=(
+                f',latency_ms={_lp_field(latency_ms)}'
+                if latency_ms is not None else ''
+            ),
+            ts=ts_ns
+        ))
     
     def _write_point(self, point: Point):
-        """Internal method to write a point"""
+        """Buffer a point; flush once the batch threshold is crossed"""
+        self._sem.acquire()
+        with self._buf_lock:
+            self._buf.append(point)
+            self._arrivals += 1
+            if len(self._buf) < self.batch_size:
+                return
+            buf, self._buf = self._buf, []
+        self._flush_records(buf)
+
+    def _write_records(self, records: list):
+        """Buffer a pre-built batch of records in one lock acquisition.
+
+        Permits are acquired per chunk of at most max_inflight_points,
+        and each chunk is buffered before the next chunk's permits are
+        taken — a producer never holds capacity for records that were
+        not buffered, which would deadlock on batches larger than the
+        inflight cap. The admit lock keeps two producers from each
+        holding part of the capacity while waiting on the rest.
+        """
+        if not records:
+            return
+        cap = self.max_inflight_points
+        for start in range(0, len(records), cap):
+            chunk = records[start:start + cap]
+            with self._admit_lock:
+                for _ in chunk:
+                    self._sem.acquire()
+            with self._buf_lock:
+                self._buf.extend(chunk)
+                self._arrivals += len(chunk)
+                if len(self._buf) < self.batch_size:
+                    continue
+                buf, self._buf = self._buf, []
+            self._flush_records(buf)
+
+    def _flush_records(self, records: list):
+        """Hand a drained batch to the client in a single write call.
+
+        The batch is collapsed to one newline-joined string first, so
+        the client serializes/encodes a single record instead of
+        walking a Python object per point — and any Point objects still
+        in the buffer are converted here, on the flushing thread,
+        rather than on the caller's hot path.
+        """
         try:
+            payload = '\n'.join(
+                r if isinstance(r, str) else r.to_line_protocol()
+                for r in records
+            )
             self.write_api.write(
                 bucket=self.bucket,
                 org=self.org,
-                record=point
+                record=payload
             )
         except Exception as e:
-            logger.error(f"Failed to write point to InfluxDB: {e}")
+            logger.error(f"Failed to write batch to InfluxDB: {e}")
+            self._release_points(len(records))
+        else:
+            if self._release_inline:
+                self._release_points(len(records))
+
+    def _release_points(self, count: int):
+        """Return capacity to producers for count committed points"""
+        for _ in range(count):
+            try:
+                self._sem.release()
+            except ValueError:
+                break
+
+    def _on_write_success(self, conf, data):
+        """Batching write API committed a batch; release its points"""
+        if isinstance(data, bytes):
+            self._release_points(data.count(b'\n') + 1)
+        else:
+            self._release_points(str(data).count('\n') + 1)
+
+    def _on_write_error(self, conf, data, exception):
+        """Batching write API gave up on a batch; log and release"""
+        logger.error(f"Failed to write batch to InfluxDB: {exception}")
+        self._on_write_success(conf, data)
+
+    def flush(self):
+        """Force-write any buffered points immediately"""
+        with self._buf_lock:
+            buf, self._buf = self._buf, []
+        if buf:
+            self._flush_records(buf)
+
+    def _flush_loop(self):
+        """Adaptive background flusher.
+
+        Tracks the recent arrival rate with an EWMA and holds points up
+        to the ski-rental optimum T* = sqrt(2*F0/rate): low-rate
+        streams get a short timer bounding their tail latency, while at
+        high rates batch_size does the flushing and the timer sits at
+        its floor. flush_interval remains the upper bound.
+        """
+        f0_s = 0.005  # approximate fixed cost of one flush
+        max_wait = max(self.flush_interval, 1) / 1000.0
+        wait = max_wait
+        cycles = 0
+        while not self._closed:
+            t0 = time.monotonic()
+            self._flush_event.wait(wait)
+            self._flush_event.clear()
+            elapsed = max(time.monotonic() - t0, 1e-3)
+            with self._buf_lock:
+                arrivals, self._arrivals = self._arrivals, 0
+            self._lambda_ewma = (
+                0.9 * self._lambda_ewma + 0.1 * (arrivals / elapsed)
+            )
+            t_star = math.sqrt(2 * f0_s / max(self._lambda_ewma, 1e-3))
+            wait = min(max(t_star, 0.05), max_wait)
+            cycles += 1
+            if cycles % 100 == 0:
+                logger.debug(
+                    f"Flush coalescer: rate={self._lambda_ewma:.1f}/s, "
+                    f"timer={wait * 1000:.0f}ms"
+                )
+            self.flush()
     
     def query_recent_prices(
         self,
@@ -294,16 +761,31 @@ class InfluxDBWriter:
         window: str = "1h"
     ) -> List[Dict[str, Any]]:
         """Query recent prices for a symbol"""
-        query = f'''
-        from(bucket: "{self.bucket}")
-            |> range(start: -{window})
-            |> filter(fn: (r) => r["_measurement"] == "market_data")
-            |> filter(fn: (r) => r["symbol"] == "{symbol}")
-            |> filter(fn: (r) => r["_field"] == "price")
-        '''
-        
+        params = {
+            '_bucket': self.bucket,
+            '_start': _window_start(window),
+            '_symbol': symbol,
+        }
+
         try:
-            result = self.query_api.query(query=query)
+            if pd is not None:
+                df = self.query_api.query_data_frame(
+                    query=_RECENT_PRICES_FLUX, params=params
+                )
+                if isinstance(df, list):
+                    df = pd.concat(df, ignore_index=True) if df else pd.DataFrame()
+                if df.empty:
+                    return []
+                return pd.DataFrame({
+                    'time': df['_time'],
+                    'price': df['_value'],
+                    'source': df['source'] if 'source' in df.columns else None,
+                }).to_dict('records')
+
+            # Row-by-row fallback when pandas is not installed
+            result = self.query_api.query(
+                query=_RECENT_PRICES_FLUX, params=params
+            )
             records = []
             for table in result:
                 for record in table.records:
@@ -322,27 +804,68 @@ class InfluxDBWriter:
         window: str = "24h"
     ) -> Dict[str, Any]:
         """Query portfolio performance over time window"""
-        query = f'''
-        from(bucket: "{self.bucket}")
-            |> range(start: -{window})
-            |> filter(fn: (r) => r["_measurement"] == "portfolio")
-            |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-        '''
-        
+        params = {
+            '_bucket': self.bucket,
+            '_start': _window_start(window),
+        }
+
         try:
-            result = self.query_api.query(query=query)
-            records = []
-            for table in result:
-                for record in table.records:
-                    records.append(record.values)
-            
+            if pd is not None:
+                df = self.query_api.query_data_frame(
+                    query=_PORTFOLIO_FLUX, params=params
+                )
+                if isinstance(df, list):
+                    df = pd.concat(df, ignore_index=True) if df else pd.DataFrame()
+                if df.empty or 'total_value' not in df.columns:
+                    return {}
+                values = df['total_value'].fillna(0).to_numpy()
+                latest_value = float(values[-1])
+                initial_value = float(values[0])
+                total_pnl = (
+                    float(df['total_pnl'].iloc[-1])
+                    if 'total_pnl' in df.columns else 0
+                )
+                return {
+                    'latest_value': latest_value,
+                    'initial_value': initial_value,
+                    'change_pct': (
+                        (latest_value - initial_value) /
+                        (initial_value or 1) * 100
+                    ),
+                    'peak_value': float(values.max()),
+                    'lowest_value': float(values.min()),
+                    'total_pnl': total_pnl,
+                }
+
+            # Row-by-row fallback when pandas is not installed
+            result = self.query_api.query(
+                query=_PORTFOLIO_FLUX, params=params
+            )
+            records = [
+                record.values for table in result for record in table.records
+            ]
+
             if not records:
                 return {}
-            
+
             # Calculate statistics
             latest = records[-1]
             initial = records[0]
-            
+
+            if np is not None:
+                # One pass into a contiguous array, then SIMD min/max in
+                # C instead of two interpreter passes over dicts
+                values = np.fromiter(
+                    (r.get('total_value', 0) for r in records),
+                    dtype=np.float64,
+                    count=len(records)
+                )
+                peak_value = float(values.max())
+                lowest_value = float(values.min())
+            else:
+                peak_value = max(r.get('total_value', 0) for r in records)
+                lowest_value = min(r.get('total_value', 0) for r in records)
+
             return {
                 'latest_value': latest.get('total_value', 0),
                 'initial_value': initial.get('total_value', 0),
@@ -350,8 +873,8 @@ class InfluxDBWriter:
                     (latest.get('total_value', 0) - initial.get('total_value', 0)) /
                     initial.get('total_value', 1) * 100
                 ),
-                'peak_value': max(r.get('total_value', 0) for r in records),
-                'lowest_value': min(r.get('total_value', 0) for r in records),
+                'peak_value': peak_value,
+                'lowest_value': lowest_value,
                 'total_pnl': latest.get('total_pnl', 0),
             }
         except Exception as e:
@@ -360,18 +883,165 @@ class InfluxDBWriter:
     
     def close(self):
         """Close client and flush remaining writes"""
+        self._closed = True
+        self._flush_event.set()
+        self.flush()
         try:
-            self.write_api.close()
-            self.client.close()
-            logger.info("InfluxDB client closed")
+            if hasattr(self.write_api, 'terminate'):
+                self.write_api.terminate()
+            else:
+                self.write_api.close()
+            # The underlying client is shared across writers and stays
+            # open for the process lifetime.
+            logger.info("InfluxDB writer closed")
         except Exception as e:
-            logger.error(f"Error closing InfluxDB client: {e}")
-    
-    def __del__(self):
-        """Cleanup on deletion"""
+            logger.error(f"Error closing InfluxDB writer: {e}")
+        finally:
+            self._finalizer.detach()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
         self.close()
 
 
+class AsyncInfluxDBWriter:
+    """asyncio-native line-protocol writer for asyncio-based callers.
+
+    The sync client's flushes block the calling thread; in an asyncio
+    host that stall lands on the event loop. This writer enqueues
+    pre-serialized lines on an asyncio.Queue and a background task
+    drains batches and POSTs them to /api/v2/write directly, so the
+    caller never waits on network I/O.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        token: Optional[str] = None,
+        org: Optional[str] = None,
+        bucket: Optional[str] = None,
+        batch_size: int = 1000,
+        flush_interval: int = 10000  # milliseconds
+    ):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AsyncInfluxDBWriter")
+
+        self.url = url or os.getenv('INFLUXDB_URL', 'http://localhost:8086')
+        self.token = token or os.getenv('INFLUXDB_TOKEN')
+        self.org = org or os.getenv('INFLUXDB_ORG', 'market-system')
+        self.bucket = bucket or os.getenv('INFLUXDB_BUCKET', 'market-data')
+        self.batch_size = int(os.getenv('INFLUXDB_BATCH_SIZE', batch_size))
+        self.flush_interval = int(
+            os.getenv('INFLUXDB_FLUSH_INTERVAL', flush_interval)
+        )
+
+        if not self.token:
+            raise ValueError("InfluxDB token not provided")
+
+        # Bounded so runaway producers block instead of growing memory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 4)
+        self._write_url = (
+            f'{self.url}/api/v2/write'
+            f'?org={self.org}&bucket={self.bucket}&precision=ns'
+        )
+        self._headers = {
+            'Authorization': f'Token {self.token}',
+            'Content-Type': 'text/plain; charset=utf-8',
+        }
+        self._session = None
+        self._flusher_task = None
+
+    async def start(self):
+        """Open the HTTP session and launch the background flusher"""
+        self._session = aiohttp.ClientSession()
+        self._flusher_task = asyncio.get_event_loop().create_task(
+            self._flusher()
+        )
+        logger.info(f"Async InfluxDB writer started: {self._write_url}")
+
+    async def write_line(self, line: str):
+        """Enqueue one pre-serialized line-protocol entry"""
+        await self._queue.put(line)
+
+    async def write_lines(self, lines: List[str]):
+        """Enqueue a batch of pre-serialized line-protocol entries"""
+        for line in lines:
+            await self._queue.put(line)
+
+    async def write_market_data(
+        self,
+        symbol: str,
+        price: float,
+        volume: float,
+        source: str,
+        sentiment: Optional[float] = None,
+        ts_ns: Optional[int] = None
+    ):
+        """Async counterpart of InfluxDBWriter.write_market_data"""
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+        fields = {'price': price, 'volume': volume}
+        if sentiment is not None:
+            fields['sentiment'] = sentiment
+        await self._queue.put(
+            _lp('market_data', {'source': source, 'symbol': symbol},
+                fields, ts_ns)
+        )
+
+    async def _flusher(self):
+        """Drain batches from the queue and POST them, overlapping I/O"""
+        loop = asyncio.get_event_loop()
+        while True:
+            lines = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval / 1000.0
+            while len(lines) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    lines.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._post('\n'.join(lines))
+
+    async def _post(self, data: str):
+        """POST one batch of line protocol to the write endpoint"""
+        try:
+            async with self._session.post(
+                self._write_url,
+                data=data.encode('utf-8'),
+                headers=self._headers
+            ) as resp:
+                if resp.status >= 300:
+                    body = await resp.text()
+                    logger.error(
+                        f"InfluxDB write failed ({resp.status}): {body}"
+                    )
+        except Exception as e:
+            logger.error(f"Failed to write batch to InfluxDB: {e}")
+
+    async def close(self):
+        """Flush whatever is queued and shut down"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            await self._post('\n'.join(remaining))
+        if self._session is not None:
+            await self._session.close()
+        logger.info("Async InfluxDB writer closed")
+
+
 # Example usage
 if __name__ == "__main__":
     import time
